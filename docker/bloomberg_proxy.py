@@ -1,29 +1,1337 @@
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, HTMLResponse
+from fastapi.responses import JSONResponse, HTMLResponse, StreamingResponse
+from starlette.datastructures import MutableHeaders
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from typing import Optional
+from urllib.parse import urlsplit
+import asyncio
+import bisect
+import calendar
+import functools
+import hashlib
 import httpx
+import json
+import logging
 import os
-from datetime import datetime
+import random
+import re
+import sqlite3
+import threading
+import time
+import uuid
+import gzip
+from datetime import datetime, timezone
 
-app = FastAPI(title="Bloomberg News Proxy")
+from html_text import html_to_text
+from json_stream import JSONPathStream
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+logger = logging.getLogger("bloomberg_proxy")
 
 RAPIDAPI_KEY = os.environ.get("RAPIDAPI_KEY", "")
 RAPIDAPI_HOST = "bloomberg-real-time.p.rapidapi.com"
 SEEKING_ALPHA_HOST = "seeking-alpha.p.rapidapi.com"
+APIFY_HOST = "api.apify.com"
 APIFY_API_TOKEN = os.environ.get("APIFY_API_TOKEN", "")
+# OpenBB platform API, source of the Benzinga feed pushed to /benzinga/stream
+OPENBB_API_URL = os.environ.get("OPENBB_API_URL", "http://openbb-platform:6900")
+BENZINGA_POLL_INTERVAL = float(os.environ.get("BENZINGA_POLL_INTERVAL", "120"))
+
+# Connection pool settings shared by the per-host upstream clients
+UPSTREAM_MAX_CONNECTIONS = int(os.environ.get("UPSTREAM_MAX_CONNECTIONS", "20"))
+UPSTREAM_MAX_KEEPALIVE = int(os.environ.get("UPSTREAM_MAX_KEEPALIVE", "10"))
+UPSTREAM_KEEPALIVE_EXPIRY = float(os.environ.get("UPSTREAM_KEEPALIVE_EXPIRY", "60"))
+UPSTREAM_HTTP2 = os.environ.get("UPSTREAM_HTTP2", "1") == "1"
+
+# Paid upstreams are rate limited per host: a token bucket of RATE_LIMIT
+# requests/sec up to BURST, plus optional DAILY_BUDGET / MONTHLY_BUDGET
+# request caps (0 = no cap), e.g. BLOOMBERG_MONTHLY_BUDGET=9000
+def upstream_limit_config(name, rate, burst):
+    return {
+        "rate": float(os.environ.get(f"{name}_RATE_LIMIT", rate)),
+        "burst": float(os.environ.get(f"{name}_BURST", burst)),
+        "daily_budget": int(os.environ.get(f"{name}_DAILY_BUDGET", "0")),
+        "monthly_budget": int(os.environ.get(f"{name}_MONTHLY_BUDGET", "0")),
+    }
+
+# Spread what is left of a budget (ours or RapidAPI's reported quota) evenly until it resets
+UPSTREAM_BUDGET_PACING = os.environ.get("UPSTREAM_BUDGET_PACING", "1") == "1"
+# Longest a request waits for a token before it is refused and cached data is served
+UPSTREAM_LIMIT_MAX_WAIT = float(os.environ.get("UPSTREAM_LIMIT_MAX_WAIT", "2"))
+# Requests counted against the daily and monthly budgets, and prefetch scrapes,
+# are kept here so a restart doesn't start a fresh day or month; "" keeps the
+# counts in memory only
+UPSTREAM_USAGE_PATH = os.environ.get("UPSTREAM_USAGE_PATH", "/app/data/usage.db")
+
+# Upstream GETs time out after UPSTREAM_TIMEOUT seconds and transient failures
+# are retried up to UPSTREAM_RETRIES times with jittered exponential backoff
+UPSTREAM_TIMEOUT = float(os.environ.get("UPSTREAM_TIMEOUT", "10"))
+UPSTREAM_RETRIES = int(os.environ.get("UPSTREAM_RETRIES", "2"))
+UPSTREAM_RETRY_BACKOFF = float(os.environ.get("UPSTREAM_RETRY_BACKOFF", "0.5"))
+UPSTREAM_RETRY_MAX_BACKOFF = float(os.environ.get("UPSTREAM_RETRY_MAX_BACKOFF", "4"))
+
+# Circuit breaker: this many consecutive failures stop calls to a host for
+# BREAKER_OPEN_SECONDS, after which a single probe decides whether to resume
+BREAKER_FAILURE_THRESHOLD = int(os.environ.get("BREAKER_FAILURE_THRESHOLD", "5"))
+BREAKER_OPEN_SECONDS = float(os.environ.get("BREAKER_OPEN_SECONDS", "30"))
+
+# Opt-in hedging of Bloomberg news/list: if the request hasn't finished after
+# the UPSTREAM_HEDGE_PERCENTILE latency of recent ones, send a second copy and
+# take whichever answers first. At most UPSTREAM_HEDGE_BUDGET hedges per request.
+UPSTREAM_HEDGE = os.environ.get("UPSTREAM_HEDGE", "0") == "1"
+UPSTREAM_HEDGE_PERCENTILE = float(os.environ.get("UPSTREAM_HEDGE_PERCENTILE", "95"))
+UPSTREAM_HEDGE_DEFAULT_DELAY = float(os.environ.get("UPSTREAM_HEDGE_DEFAULT_DELAY", "1"))
+UPSTREAM_HEDGE_BUDGET = float(os.environ.get("UPSTREAM_HEDGE_BUDGET", "0.05"))
+
+# Parse the big news list bodies as they stream in, keeping only the stories
+UPSTREAM_STREAM_PARSE = os.environ.get("UPSTREAM_STREAM_PARSE", "1") == "1"
+
+# Parsed news feeds are cached per source; stale entries may be served while
+# a background refresh runs (stale-while-revalidate)
+FEED_TTLS = {
+    "bloomberg": float(os.environ.get("BLOOMBERG_FEED_TTL", "60")),
+    "seekingalpha": float(os.environ.get("SEEKINGALPHA_FEED_TTL", "120")),
+}
+FEED_CACHE_MAX_ENTRIES = int(os.environ.get("FEED_CACHE_MAX_ENTRIES", "256"))
+FEED_CACHE_SWR = os.environ.get("FEED_CACHE_SWR", "1") == "1"
+FEED_CACHE_MAX_STALE = float(os.environ.get("FEED_CACHE_MAX_STALE", "600"))
+# "memory" keeps feeds per process; "sqlite" keeps them in a WAL-mode file that
+# survives restarts and that several processes can share. The proxy itself runs
+# as one worker: article jobs and since-cursors are still per process.
+FEED_CACHE_BACKEND = os.environ.get("FEED_CACHE_BACKEND", "memory")
+FEED_CACHE_PATH = os.environ.get("FEED_CACHE_PATH", "/app/data/feeds.db")
+
+# Seeking Alpha lists leave bodies out (text null, has_body set) and strip one
+# only when its article is opened; bodies are kept per article id either way
+SEEKINGALPHA_LAZY_BODIES = os.environ.get("SEEKINGALPHA_LAZY_BODIES", "1") == "1"
+SEEKINGALPHA_BODY_CACHE_SIZE = int(os.environ.get("SEEKINGALPHA_BODY_CACHE_SIZE", "2000"))
+# Unstripped HTML runs to tens of KB an article, so the bodies are capped by size too
+SEEKINGALPHA_BODY_CACHE_MAX_BYTES = int(os.environ.get("SEEKINGALPHA_BODY_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+# /seekingalpha/news?symbols= fetches at most this many uncached symbols at once
+SEEKINGALPHA_BATCH_CONCURRENCY = int(os.environ.get("SEEKINGALPHA_BATCH_CONCURRENCY", "4"))
+SEEKINGALPHA_BATCH_MAX_SYMBOLS = int(os.environ.get("SEEKINGALPHA_BATCH_MAX_SYMBOLS", "50"))
+
+# Background Bloomberg poller; 0 disables it and views are built on demand
+BLOOMBERG_POLL_INTERVAL = float(os.environ.get("BLOOMBERG_POLL_INTERVAL", "60"))
+# Stories kept across fetches for paging past the upstream window
+BLOOMBERG_STORE_MAX_STORIES = int(os.environ.get("BLOOMBERG_STORE_MAX_STORIES", "5000"))
+
+# Scraped articles persist in SQLite so they survive container restarts; "" disables
+ARTICLE_CACHE_PATH = os.environ.get("ARTICLE_CACHE_PATH", "/app/data/articles.db")
+ARTICLE_CACHE_MAX_BYTES = int(os.environ.get("ARTICLE_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))
+
+# Full-text index behind /search over every provider's headlines and scraped articles; "" disables
+SEARCH_INDEX_PATH = os.environ.get("SEARCH_INDEX_PATH", "/app/data/search.db")
+# Only the newest this many matches of a query are ranked, bounding queries for very common words
+SEARCH_RANK_WINDOW = int(os.environ.get("SEARCH_RANK_WINDOW", "2000"))
+
+# Article scrapes run as background jobs on a bounded worker pool
+ARTICLE_WORKERS = int(os.environ.get("ARTICLE_WORKERS", "2"))
+ARTICLE_JOB_TTL = float(os.environ.get("ARTICLE_JOB_TTL", "900"))
+
+# Speculative scraping of the top stories of each new feed snapshot; 0 disables
+ARTICLE_PREFETCH_TOP_N = int(os.environ.get("ARTICLE_PREFETCH_TOP_N", "0"))
+ARTICLE_PREFETCH_DAILY_BUDGET = int(os.environ.get("ARTICLE_PREFETCH_DAILY_BUDGET", "50"))
+ARTICLE_PREFETCH_CONCURRENCY = int(os.environ.get("ARTICLE_PREFETCH_CONCURRENCY", "1"))
+
+# Terminal pages are static: let browsers keep them and revalidate by ETag
+TERMINAL_CACHE_MAX_AGE = int(os.environ.get("TERMINAL_CACHE_MAX_AGE", "86400"))
+
+# Response compression; bodies smaller than this go out as they are
+COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", "1024"))
+# Levels for bodies compressed per response, and for prebuilt feed bodies
+# that are compressed once and reused until the next snapshot
+COMPRESSION_LEVELS = {"br": 4, "zstd": 3, "gzip": 6}
+PREBUILT_COMPRESSION_LEVELS = {"br": 9, "zstd": 12, "gzip": 9}
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import h2  # noqa: F401 - HTTP/2 needs the optional httpx[http2] extra
+except ImportError:
+    UPSTREAM_HTTP2 = False
 
 headers = {
     "x-rapidapi-host": RAPIDAPI_HOST,
     "x-rapidapi-key": RAPIDAPI_KEY,
 }
 
+# One pooled client per upstream host, created in the app lifespan
+clients = {}
+client_requests = {}
+
+def get_client(host):
+    """Return the shared client for an upstream host, creating it on first use"""
+    client = clients.get(host)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            http2=UPSTREAM_HTTP2,
+            limits=httpx.Limits(
+                max_connections=UPSTREAM_MAX_CONNECTIONS,
+                max_keepalive_connections=UPSTREAM_MAX_KEEPALIVE,
+                keepalive_expiry=UPSTREAM_KEEPALIVE_EXPIRY,
+            ),
+            event_hooks={"request": [count_request, limit_request], "response": [observe_response]},
+        )
+        clients[host] = client
+    return client
+
+async def count_request(request):
+    host = request.url.host
+    client_requests[host] = client_requests.get(host, 0) + 1
+
+async def close_clients():
+    for client in clients.values():
+        await client.aclose()
+    clients.clear()
+
+def pool_stats():
+    """Connection pool utilisation per upstream host"""
+    stats = {}
+    for host, client in clients.items():
+        # httpcore does not expose pool counters publicly, so read them defensively
+        pool = getattr(getattr(client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        idle = sum(1 for c in connections if c.is_idle())
+        closed = sum(1 for c in connections if c.is_closed())
+        queued = sum(1 for r in getattr(pool, "_requests", []) if r.is_queued())
+        stats[host] = {
+            "connections": len(connections),
+            "active": len(connections) - idle - closed,
+            "idle": idle,
+            "queued_requests": queued,
+            "max_connections": UPSTREAM_MAX_CONNECTIONS,
+            "max_keepalive": UPSTREAM_MAX_KEEPALIVE,
+            "http2": UPSTREAM_HTTP2,
+            "requests": client_requests.get(host, 0),
+        }
+    return stats
+
+def rapidapi_headers(host):
+    return {
+        "x-rapidapi-host": host,
+        "x-rapidapi-key": RAPIDAPI_KEY,
+    }
+
+class UpstreamBudgetExceeded(HTTPException):
+    """Raised instead of calling an upstream that is out of tokens or budget"""
+
+    def __init__(self, host, retry_after):
+        super().__init__(
+            status_code=429,
+            detail=f"Upstream request budget for {host} exhausted",
+            headers={"Retry-After": str(int(retry_after) + 1)},
+        )
+
+def seconds_until_reset(period):
+    """Seconds until the current UTC day or month ends"""
+    now = time.time()
+    if period == "day":
+        return 86400 - now % 86400
+    year, month = time.gmtime(now)[:2]
+    year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return calendar.timegm((year, month, 1, 0, 0, 0)) - now
+
+class UpstreamUsage:
+    """Budgeted request counts per host and UTC day or month, kept in SQLite
+
+    take() checks and bumps a host's counts in one write transaction, so
+    every process opening the file draws on the same budgets.
+    """
+
+    def __init__(self, path):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS usage ("
+            " host TEXT NOT NULL, period TEXT NOT NULL, count INTEGER NOT NULL, PRIMARY KEY (host, period))"
+        )
+
+    def read(self, host, day, month):
+        rows = dict(self.db.execute(
+            "SELECT period, count FROM usage WHERE host = ? AND period IN (?, ?)", (host, day, month)
+        ).fetchall())
+        return rows.get(day, 0), rows.get(month, 0)
+
+    def counts(self, host, day, month):
+        """(requests today, requests this month) for host"""
+        with self.lock:
+            return self.read(host, day, month)
+
+    def take(self, host, day, month, daily_budget, monthly_budget):
+        """Count one request unless a budget is used up; returns (taken, today, this month)"""
+        with self.lock:
+            self.db.execute("BEGIN IMMEDIATE")
+            try:
+                day_count, month_count = self.read(host, day, month)
+                taken = ((not daily_budget or day_count < daily_budget)
+                         and (not monthly_budget or month_count < monthly_budget))
+                if taken:
+                    self.db.executemany(
+                        "INSERT INTO usage (host, period, count) VALUES (?, ?, 1)"
+                        " ON CONFLICT (host, period) DO UPDATE SET count = count + 1",
+                        ((host, day), (host, month)),
+                    )
+                    day_count += 1
+                    month_count += 1
+                # "YYYY-MM-DD" and "YYYY-MM" both sort before the current month once they are over
+                self.db.execute("DELETE FROM usage WHERE period < ?", (month,))
+                self.db.execute("COMMIT")
+            except BaseException:
+                self.db.execute("ROLLBACK")
+                raise
+        return taken, day_count, month_count
+
+    def give_back(self, host, day, month):
+        """Undo a take() whose request turned out not to be needed"""
+        with self.lock:
+            self.db.execute(
+                "UPDATE usage SET count = count - 1 WHERE host = ? AND period IN (?, ?) AND count > 0",
+                (host, day, month),
+            )
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+upstream_usage = None
+
+class UpstreamLimiter:
+    """Token bucket and request budgets for one paid upstream host
+
+    Tokens refill at rate per second up to burst. With pacing on, the
+    refill rate is lowered so whatever is left of the daily and monthly
+    budgets, and of the plan quota RapidAPI reports in its
+    x-ratelimit-requests-* headers, lasts until that budget resets. A 429
+    from upstream stops requests until its Retry-After has passed. Once
+    load() has given it an UpstreamUsage, the budget counts live there.
+    """
+
+    def __init__(self, host, rate, burst, daily_budget=0, monthly_budget=0):
+        self.host = host
+        self.rate = rate
+        self.burst = burst
+        self.daily_budget = daily_budget
+        self.monthly_budget = monthly_budget
+        self.tokens = burst
+        self.updated = time.monotonic()
+        self.day = None
+        self.month = None
+        self.day_count = 0
+        self.month_count = 0
+        self.upstream_remaining = None
+        self.upstream_reset_at = 0.0
+        self.blocked_until = 0.0
+        self.usage = None
+        self.stats = {"sent": 0, "waited": 0, "refused": 0, "throttled": 0}
+
+    def load(self, usage):
+        """Count budgeted requests in usage from now on, carrying on from what it holds"""
+        self.budgets()
+        self.day_count, self.month_count = usage.counts(self.host, self.day, self.month)
+        self.usage = usage
+
+    def budgets(self):
+        """(requests left, seconds until reset) for every budget in force"""
+        today = time.strftime("%Y-%m-%d", time.gmtime())
+        if today != self.day:
+            self.day, self.day_count = today, 0
+        if today[:7] != self.month:
+            self.month, self.month_count = today[:7], 0
+        budgets = []
+        if self.daily_budget:
+            budgets.append((self.daily_budget - self.day_count, seconds_until_reset("day")))
+        if self.monthly_budget:
+            budgets.append((self.monthly_budget - self.month_count, seconds_until_reset("month")))
+        reset_in = self.upstream_reset_at - time.monotonic()
+        if self.upstream_remaining is not None and reset_in > 0:
+            budgets.append((self.upstream_remaining, reset_in))
+        return budgets
+
+    def refill_rate(self, budgets):
+        rate = self.rate
+        if UPSTREAM_BUDGET_PACING:
+            for left, reset_in in budgets:
+                rate = min(rate, max(left, 0) / max(reset_in, 1.0))
+        return rate
+
+    async def acquire(self, max_wait):
+        while True:
+            budgets = self.budgets()
+            rate = self.refill_rate(budgets)
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * rate)
+            self.updated = now
+            exhausted = [reset_in for left, reset_in in budgets if left <= 0]
+            if exhausted:
+                wait = max(exhausted)
+            elif now < self.blocked_until:
+                wait = self.blocked_until - now
+            elif self.tokens >= 1:
+                self.tokens -= 1
+                if self.usage is None:
+                    self.day_count += 1
+                    self.month_count += 1
+                else:
+                    taken, self.day_count, self.month_count = await asyncio.to_thread(
+                        self.usage.take, self.host, self.day, self.month, self.daily_budget, self.monthly_budget
+                    )
+                    if not taken:
+                        # Another process used up the rest of the budget
+                        self.tokens += 1
+                        continue
+                if self.upstream_remaining is not None:
+                    self.upstream_remaining -= 1
+                self.stats["sent"] += 1
+                return
+            else:
+                wait = (1 - self.tokens) / rate if rate > 0 else float("inf")
+            if wait > max_wait:
+                self.stats["refused"] += 1
+                raise UpstreamBudgetExceeded(self.host, min(wait, 86400))
+            self.stats["waited"] += 1
+            await asyncio.sleep(wait)
+
+    def observe(self, response):
+        headers = response.headers
+        try:
+            remaining = headers.get("x-ratelimit-requests-remaining")
+            reset = headers.get("x-ratelimit-requests-reset")
+            if remaining is not None and reset is not None:
+                self.upstream_remaining = int(remaining)
+                self.upstream_reset_at = time.monotonic() + float(reset)
+        except ValueError:
+            pass
+        if response.status_code == 429:
+            self.stats["throttled"] += 1
+            try:
+                delay = float(headers.get("retry-after", "60"))
+            except ValueError:
+                # An HTTP-date; not worth parsing for a backoff
+                delay = 60.0
+            self.blocked_until = time.monotonic() + delay
+
+    def info(self):
+        budgets = self.budgets()
+        return {
+            "rate": self.rate,
+            "effective_rate": self.refill_rate(budgets),
+            "burst": self.burst,
+            "tokens": round(self.tokens, 2),
+            "daily_budget": self.daily_budget,
+            "today": self.day_count,
+            "monthly_budget": self.monthly_budget,
+            "this_month": self.month_count,
+            "upstream_remaining": self.upstream_remaining,
+            **self.stats,
+        }
+
+limiters = {
+    RAPIDAPI_HOST: UpstreamLimiter(RAPIDAPI_HOST, **upstream_limit_config("BLOOMBERG", "2", "5")),
+    SEEKING_ALPHA_HOST: UpstreamLimiter(SEEKING_ALPHA_HOST, **upstream_limit_config("SEEKINGALPHA", "2", "5")),
+    APIFY_HOST: UpstreamLimiter(APIFY_HOST, **upstream_limit_config("APIFY", "0.5", "2")),
+}
+
+async def limit_request(request):
+    limiter = limiters.get(request.url.host)
+    if limiter is not None:
+        await limiter.acquire(UPSTREAM_LIMIT_MAX_WAIT)
+
+async def observe_response(response):
+    limiter = limiters.get(response.request.url.host)
+    if limiter is not None:
+        limiter.observe(response)
+
+class UpstreamUnavailable(HTTPException):
+    """Raised instead of calling an upstream whose circuit is open"""
+
+    def __init__(self, host, retry_after):
+        super().__init__(
+            status_code=503,
+            detail=f"Upstream {host} is failing; not retrying for now",
+            headers={"Retry-After": str(int(retry_after) + 1)},
+        )
+
+class CircuitBreaker:
+    """Closed / open / half-open state of one upstream host
+
+    BREAKER_FAILURE_THRESHOLD consecutive failures open the circuit and
+    every request fails fast for BREAKER_OPEN_SECONDS. After that the
+    circuit is half-open: one probe request goes through, and its outcome
+    closes the circuit or opens it again.
+    """
+
+    def __init__(self, host):
+        self.host = host
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self.probing = False
+        self.stats = {"failures": 0, "opened": 0, "rejected": 0}
+
+    def allow(self):
+        """Raise UpstreamUnavailable unless a request may go out; True if it is the probe"""
+        if self.state == "open":
+            remaining = self.opened_at + BREAKER_OPEN_SECONDS - time.monotonic()
+            if remaining > 0:
+                self.stats["rejected"] += 1
+                raise UpstreamUnavailable(self.host, remaining)
+            self.state = "half_open"
+        if self.state == "half_open":
+            if self.probing:
+                self.stats["rejected"] += 1
+                raise UpstreamUnavailable(self.host, 0)
+            self.probing = True
+            return True
+        return False
+
+    def finish(self, probe, ok):
+        """Record a request's outcome; ok is None when it ended without telling us anything"""
+        if probe:
+            self.probing = False
+        if ok is None:
+            return
+        if ok:
+            self.state = "closed"
+            self.failures = 0
+            return
+        self.failures += 1
+        self.stats["failures"] += 1
+        if probe or self.failures >= BREAKER_FAILURE_THRESHOLD:
+            if self.state != "open":
+                self.stats["opened"] += 1
+                logger.warning("Circuit for %s opened after %d failures", self.host, self.failures)
+            self.state = "open"
+            self.opened_at = time.monotonic()
+
+    def info(self):
+        return {"state": self.state, "consecutive_failures": self.failures, **self.stats}
+
+breakers = {}
+retry_stats = {"retries": 0}
+
+def get_breaker(host):
+    breaker = breakers.get(host)
+    if breaker is None:
+        breaker = breakers[host] = CircuitBreaker(host)
+    return breaker
+
+# Replies worth another attempt; any 5xx counts against the circuit
+RETRY_STATUSES = {500, 502, 503, 504}
+
+async def send_upstream(host, method, url, retries=0, read=None, **kwargs):
+    """Send a request to an upstream host through its circuit breaker
+
+    Transport errors and timeouts are raised, and 5xx replies returned,
+    once retries further attempts with full-jitter exponential backoff
+    have also failed. Only idempotent requests should pass retries.
+
+    With read, the body is streamed and read(response) is awaited within
+    the same attempt, so a connection that drops mid-body is retried and
+    counted against the host; its result is returned instead of the
+    response, which is closed by then.
+    """
+    breaker = get_breaker(host)
+    client = get_client(host)
+    attempt = 0
+    while True:
+        probe = breaker.allow()
+        response = None
+        try:
+            response = await client.send(client.build_request(method, url, **kwargs), stream=read is not None)
+            final = response.status_code not in RETRY_STATUSES or attempt >= retries
+            if read is not None:
+                try:
+                    result = await read(response) if final else None
+                finally:
+                    await response.aclose()
+        except httpx.TransportError:
+            breaker.finish(probe, False)
+            if attempt >= retries:
+                raise
+        except asyncio.CancelledError:
+            breaker.finish(probe, None)
+            raise
+        except BaseException:
+            # Refused by the rate limiter: says nothing about the host. A reply
+            # that read() turned down still counts by its status.
+            breaker.finish(probe, None if response is None else response.status_code < 500)
+            raise
+        else:
+            breaker.finish(probe, response.status_code < 500)
+            if final:
+                return response if read is None else result
+        attempt += 1
+        retry_stats["retries"] += 1
+        await asyncio.sleep(random.uniform(0, min(UPSTREAM_RETRY_MAX_BACKOFF, UPSTREAM_RETRY_BACKOFF * 2 ** attempt)))
+
+class Hedger:
+    """Recent latencies and hedge budget of one hedged upstream resource"""
+
+    # Samples needed before the percentile replaces UPSTREAM_HEDGE_DEFAULT_DELAY
+    MIN_SAMPLES = 20
+
+    def __init__(self):
+        self.latencies = deque(maxlen=200)
+        self.credit = 1.0
+        self.stats = {"requests": 0, "hedged": 0, "hedge_wins": 0, "over_budget": 0}
+
+    def delay(self):
+        if len(self.latencies) < self.MIN_SAMPLES:
+            return UPSTREAM_HEDGE_DEFAULT_DELAY
+        latencies = sorted(self.latencies)
+        return latencies[min(len(latencies) - 1, int(len(latencies) * UPSTREAM_HEDGE_PERCENTILE / 100))]
+
+    def take(self):
+        """Spend budget on one hedge, if there is any left"""
+        if self.credit < 1:
+            self.stats["over_budget"] += 1
+            return False
+        self.credit -= 1
+        self.stats["hedged"] += 1
+        return True
+
+    def info(self):
+        return {"delay": round(self.delay(), 3), "samples": len(self.latencies), **self.stats}
+
+HEDGED_REQUESTS = {(RAPIDAPI_HOST, "/news/list")}
+hedgers = {}
+
+async def send_hedged(host, method, url, **kwargs):
+    """send_upstream, plus a second identical request if the first is slower than usual
+
+    The first successful reply wins and the other request is cancelled.
+    With a read callback, a reply only counts once its body has been read,
+    and so do the latencies the hedge delay is drawn from.
+    """
+    key = (host, urlsplit(url).path)
+    hedger = hedgers.get(key)
+    if hedger is None:
+        hedger = hedgers[key] = Hedger()
+    hedger.stats["requests"] += 1
+    # Every request earns a fraction of a hedge, so hedges stay a bounded share of quota
+    hedger.credit = min(hedger.credit + UPSTREAM_HEDGE_BUDGET, 10.0)
+    
+    async def attempt():
+        started = time.monotonic()
+        response = await send_upstream(host, method, url, **kwargs)
+        hedger.latencies.append(time.monotonic() - started)
+        return response
+    
+    primary = asyncio.ensure_future(attempt())
+    tasks = [primary]
+    try:
+        done, pending = await asyncio.wait(tasks, timeout=hedger.delay())
+        if not done and hedger.take():
+            tasks.append(asyncio.ensure_future(attempt()))
+        pending = set(tasks)
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Reading every exception keeps a failed loser from being reported as unretrieved
+            succeeded = [task for task in done if task.exception() is None]
+            if succeeded:
+                if succeeded[0] is not primary:
+                    hedger.stats["hedge_wins"] += 1
+                return succeeded[0].result()
+        return primary.result()
+    finally:
+        for task in tasks:
+            task.cancel()
+
+# Upstream GETs currently in flight, keyed on host, path and params
+inflight = {}
+singleflight_stats = {"fetches": 0, "coalesced": 0}
+
+async def fetch_upstream_json(host, path, params=None):
+    """GET a RapidAPI resource and parse it, raising HTTPException on a non-200 reply
+
+    Returns the parsed payload together with a digest of the raw body,
+    which downstream ETags are derived from.
+    """
+    send = send_hedged if UPSTREAM_HEDGE and (host, path) in HEDGED_REQUESTS else send_upstream
+    streamed = STREAMED_PAYLOADS.get((host, path)) if UPSTREAM_STREAM_PARSE else None
+    result = await send(
+        host,
+        "GET",
+        f"https://{host}{path}",
+        retries=UPSTREAM_RETRIES,
+        read=streamed_reader(*streamed) if streamed is not None else None,
+        headers=rapidapi_headers(host),
+        params=params,
+        timeout=UPSTREAM_TIMEOUT
+    )
+    if streamed is not None:
+        # The reader has already parsed the body into (payload, digest)
+        return result
+    response = result
+    if response.status_code != 200:
+        raise HTTPException(status_code=response.status_code, detail=response.text)
+    return response.json(), hashlib.blake2b(response.content, digest_size=16).hexdigest()
+
+def streamed_reader(paths, build):
+    """A send_upstream read callback that parses a 200 body while it streams in"""
+    async def read(response):
+        if response.status_code != 200:
+            await response.aread()
+            raise HTTPException(status_code=response.status_code, detail=response.text)
+        return await read_streamed_payload(response, paths, build)
+    return read
+
+async def read_streamed_payload(response, paths, build):
+    """Parse a streamed body as it arrives, keeping only the values at paths
+
+    build turns the values found for each label into the payload callers
+    expect. The digest still covers the whole body.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    parser = JSONPathStream(paths)
+    found = {label: [] for label in paths.values()}
+    async for chunk in response.aiter_bytes():
+        digest.update(chunk)
+        for label, value in parser.feed(chunk):
+            found[label].append(value)
+    for label, value in parser.close():
+        found[label].append(value)
+    return build(found), digest.hexdigest()
+
+def bloomberg_list_payload(found):
+    status = found["status"][0] if found["status"] else None
+    return {"status": status, "data": {"modules": [{"stories": found["stories"]}]}}
+
+def seekingalpha_list_payload(found):
+    return {"data": found["data"], "included": found["included"]}
+
+SEEKINGALPHA_LIST_PATHS = {("data", "*"): "data", ("included", "*"): "included"}
+
+# Big list responses that are parsed while they stream in, as (paths, build):
+# only the parts the normalization adapters read are ever decoded or cached
+STREAMED_PAYLOADS = {
+    (RAPIDAPI_HOST, "/news/list"): (
+        {("status",): "status", ("data", "modules", "*", "stories", "*"): "stories"},
+        bloomberg_list_payload,
+    ),
+    (SEEKING_ALPHA_HOST, "/news/list"): (SEEKINGALPHA_LIST_PATHS, seekingalpha_list_payload),
+    (SEEKING_ALPHA_HOST, "/news/v2/list"): (SEEKINGALPHA_LIST_PATHS, seekingalpha_list_payload),
+}
+
+def request_key(host, path, params=None):
+    return (host, path, tuple(sorted((params or {}).items())))
+
+async def fetch_json(host, path, params=None):
+    """Single-flight wrapper around fetch_upstream_json
+
+    Concurrent callers asking for the same resource await one upstream
+    request and share its (payload, digest) result or its exception.
+    """
+    key = request_key(host, path, params)
+    future = inflight.get(key)
+    if future is None:
+        singleflight_stats["fetches"] += 1
+        future = asyncio.ensure_future(fetch_upstream_json(host, path, params))
+        inflight[key] = future
+        future.add_done_callback(lambda f: finish_flight(key, f))
+    else:
+        singleflight_stats["coalesced"] += 1
+    # Shield so one cancelled caller doesn't abort the fetch for everyone else
+    return await asyncio.shield(future)
+
+def finish_flight(key, future):
+    inflight.pop(key, None)
+    # Mark the exception as retrieved in case every waiter was cancelled
+    if not future.cancelled():
+        future.exception()
+
+class FeedCache:
+    """Bounded LRU of parsed upstream payloads, stamped with their fetch time
+
+    Entries are ((payload, digest), fetched_at) with fetched_at in epoch
+    seconds, the same for every backend.
+    """
+
+    backend = "memory"
+
+    def __init__(self, max_entries):
+        self.max_entries = max_entries
+        self.entries = OrderedDict()
+        self.stats = {"hits": 0, "stale_hits": 0, "misses": 0, "evictions": 0, "budget_hits": 0, "breaker_hits": 0}
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def set(self, key, value):
+        self.entries[key] = (value, time.time())
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_entries:
+            self.entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    async def load(self, key):
+        """get() for use on the event loop"""
+        return self.get(key)
+
+    async def store(self, key, value):
+        """set() for use on the event loop"""
+        self.set(key, value)
+
+    def info(self):
+        return {"backend": self.backend, "entries": len(self.entries), "max_entries": self.max_entries, **self.stats}
+
+class SQLiteFeedCache(FeedCache):
+    """Feed cache kept in a SQLite WAL file that every worker process opens
+
+    A feed one worker fetched is served by all of them until it expires.
+    Parsed payloads are memoized per process by digest, so a body is only
+    decoded again after some worker stored a new one. Once over
+    max_entries, the least recently fetched feeds are dropped. load() and
+    store() run in a thread, since another writer can hold the file lock.
+    """
+
+    backend = "sqlite"
+
+    def __init__(self, path, max_entries):
+        super().__init__(max_entries)
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS feeds ("
+            " key TEXT PRIMARY KEY, digest TEXT NOT NULL, payload BLOB NOT NULL, fetched_at REAL NOT NULL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS feeds_fetched ON feeds (fetched_at)")
+        self.db.commit()
+
+    def get(self, key):
+        name = json.dumps(key)
+        with self.lock:
+            row = self.db.execute("SELECT digest, fetched_at FROM feeds WHERE key = ?", (name,)).fetchone()
+            if row is None:
+                return None
+            digest, fetched_at = row
+            entry = self.entries.get(name)
+            if entry is None or entry[1] != digest:
+                row = self.db.execute("SELECT payload FROM feeds WHERE key = ? AND digest = ?", (name, digest)).fetchone()
+                if row is None:
+                    return None
+                entry = self.entries[name] = (json.loads(row[0]), digest)
+            self.entries.move_to_end(name)
+            while len(self.entries) > self.max_entries:
+                self.entries.popitem(last=False)
+        return entry, fetched_at
+
+    def set(self, key, value):
+        name = json.dumps(key)
+        data, digest = value
+        payload = render_json(data)
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO feeds (key, digest, payload, fetched_at) VALUES (?, ?, ?, ?)",
+                (name, digest, payload, time.time()),
+            )
+            evicted = self.db.execute(
+                "DELETE FROM feeds WHERE key NOT IN (SELECT key FROM feeds ORDER BY fetched_at DESC LIMIT ?)",
+                (self.max_entries,),
+            ).rowcount
+            self.db.commit()
+            self.stats["evictions"] += evicted
+            self.entries[name] = value
+            self.entries.move_to_end(name)
+
+    async def load(self, key):
+        return await asyncio.to_thread(self.get, key)
+
+    async def store(self, key, value):
+        await asyncio.to_thread(self.set, key, value)
+
+    def info(self):
+        with self.lock:
+            count = self.db.execute("SELECT COUNT(*) FROM feeds").fetchone()[0]
+        return {"backend": self.backend, "entries": count, "max_entries": self.max_entries, **self.stats}
+
+if FEED_CACHE_BACKEND == "sqlite":
+    feed_cache = SQLiteFeedCache(FEED_CACHE_PATH, FEED_CACHE_MAX_ENTRIES)
+elif FEED_CACHE_BACKEND == "memory":
+    feed_cache = FeedCache(FEED_CACHE_MAX_ENTRIES)
+else:
+    raise ValueError(f"Unknown FEED_CACHE_BACKEND {FEED_CACHE_BACKEND!r}, expected memory or sqlite")
+# Keys with a background refresh running, plus strong refs to those tasks
+refreshing = set()
+refresh_tasks = set()
+
+async def fetch_feed(source, host, path, params=None):
+    """Fetch a news feed's (payload, digest) through the per-source TTL cache
+
+    Fresh entries are returned as-is. With stale-while-revalidate enabled,
+    an expired entry younger than FEED_CACHE_MAX_STALE is served immediately
+    while one background task refreshes it. If the upstream is out of
+    tokens or budget, or its circuit is open, the cached entry is served
+    whatever its age.
+    """
+    key = request_key(host, path, params)
+    entry = await feed_cache.load(key)
+    if entry is not None:
+        value, fetched_at = entry
+        age = time.time() - fetched_at
+        if age < FEED_TTLS[source]:
+            feed_cache.stats["hits"] += 1
+            return value
+        if FEED_CACHE_SWR and age < FEED_TTLS[source] + FEED_CACHE_MAX_STALE:
+            feed_cache.stats["stale_hits"] += 1
+            if key not in refreshing:
+                refreshing.add(key)
+                task = asyncio.create_task(refresh_feed(key, host, path, params))
+                refresh_tasks.add(task)
+                task.add_done_callback(refresh_tasks.discard)
+            return value
+    feed_cache.stats["misses"] += 1
+    try:
+        value = await fetch_json(host, path, params)
+    except (UpstreamBudgetExceeded, UpstreamUnavailable) as e:
+        # Out of upstream budget or circuit open: the last known good copy beats no data
+        if entry is None:
+            raise
+        feed_cache.stats["budget_hits" if isinstance(e, UpstreamBudgetExceeded) else "breaker_hits"] += 1
+        return entry[0]
+    await feed_cache.store(key, value)
+    return value
+
+async def refresh_feed(key, host, path, params):
+    try:
+        await feed_cache.store(key, await fetch_json(host, path, params))
+    except Exception as e:
+        logger.warning("Background refresh of %s%s failed: %s", host, path, e)
+    finally:
+        refreshing.discard(key)
+
+def normalize_article_url(url):
+    """Canonical form of an article URL: lowercase host, no query, fragment or trailing slash"""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip("/") or "/"
+    return f"https://{parts.netloc.lower()}{path}"
+
+class ArticleCache:
+    """Persistent SQLite store of scraped articles keyed by a hash of the normalized URL
+
+    The total stored size is capped at max_bytes; once over it, the least
+    recently read articles are evicted first.
+    """
+
+    def __init__(self, path, max_bytes):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS articles ("
+            " key TEXT PRIMARY KEY, url TEXT NOT NULL, article TEXT NOT NULL,"
+            " size INTEGER NOT NULL, created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS articles_accessed ON articles (accessed_at)")
+        self.db.commit()
+
+    @staticmethod
+    def key(url):
+        return hashlib.sha256(normalize_article_url(url).encode()).hexdigest()
+
+    def get(self, url):
+        key = self.key(url)
+        with self.lock:
+            row = self.db.execute("SELECT article FROM articles WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            self.db.execute("UPDATE articles SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            self.db.commit()
+        return json.loads(row[0])
+
+    def put(self, url, article):
+        blob = json.dumps(article)
+        now = time.time()
+        with self.lock:
+            self.db.execute(
+                "INSERT OR REPLACE INTO articles (key, url, article, size, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (self.key(url), normalize_article_url(url), blob, len(blob), now, now),
+            )
+            self.evict()
+            self.db.commit()
+
+    def evict(self):
+        total = self.db.execute("SELECT COALESCE(SUM(size), 0) FROM articles").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        rows = self.db.execute("SELECT key, size FROM articles ORDER BY accessed_at").fetchall()
+        for key, size in rows:
+            if total <= self.max_bytes:
+                break
+            self.db.execute("DELETE FROM articles WHERE key = ?", (key,))
+            total -= size
+            self.stats["evictions"] += 1
+
+    def info(self):
+        with self.lock:
+            count, size = self.db.execute("SELECT COUNT(*), COALESCE(SUM(size), 0) FROM articles").fetchone()
+        return {"articles": count, "bytes": size, "max_bytes": self.max_bytes, **self.stats}
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+article_cache = None
+
+class SearchIndex:
+    """SQLite FTS5 index over headlines and article bodies from every provider
+
+    docs holds one row per document (provider, url, published time) and
+    the FTS5 table holds its title and body under the same rowid. Adding a
+    document that is already indexed only rewrites it if something
+    changed, and an empty title or body never replaces a stored one, so a
+    headline and its later scraped article end up as one document.
+    """
+
+    def __init__(self, path):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.stats = {"indexed": 0, "queries": 0}
+        self.lock = threading.Lock()
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS docs ("
+            " id TEXT PRIMARY KEY, provider TEXT NOT NULL, url TEXT NOT NULL, published REAL NOT NULL)"
+        )
+        self.db.execute("CREATE INDEX IF NOT EXISTS docs_published ON docs (published)")
+        self.db.execute("CREATE VIRTUAL TABLE IF NOT EXISTS search USING fts5(title, body, tokenize='porter unicode61')")
+        self.db.commit()
+
+    def add(self, docs, fill=False):
+        """Index documents given as dicts of id, provider, title, body, url and published
+
+        With fill, a stored document keeps its published time and title and
+        only takes the body, as when a scraped article joins its headline:
+        the listing's timestamp is exact where a scraped date may be a day.
+        """
+        indexed = 0
+        with self.lock:
+            for doc in docs:
+                row = self.db.execute(
+                    "SELECT docs.rowid, docs.published, search.title, search.body"
+                    " FROM docs JOIN search ON search.rowid = docs.rowid WHERE docs.id = ?",
+                    (doc["id"],),
+                ).fetchone()
+                if row is None:
+                    # Bodies can arrive for documents that were never listed; there's nothing to show for those
+                    if not doc["title"]:
+                        continue
+                    rowid = self.db.execute(
+                        "INSERT INTO docs (id, provider, url, published) VALUES (?, ?, ?, ?)",
+                        (doc["id"], doc["provider"], doc["url"], doc["published"]),
+                    ).lastrowid
+                    self.db.execute("INSERT INTO search (rowid, title, body) VALUES (?, ?, ?)",
+                                    (rowid, doc["title"], doc["body"]))
+                else:
+                    rowid, published, title, body = row
+                    if fill:
+                        updated = (published or doc["published"], title or doc["title"], doc["body"] or body)
+                    else:
+                        updated = (doc["published"] or published, doc["title"] or title, doc["body"] or body)
+                    if updated == (published, title, body):
+                        continue
+                    self.db.execute("UPDATE docs SET published = ? WHERE rowid = ?", (updated[0], rowid))
+                    self.db.execute("UPDATE search SET title = ?, body = ? WHERE rowid = ?", (*updated[1:], rowid))
+                indexed += 1
+            self.db.commit()
+        self.stats["indexed"] += indexed
+        return indexed
+
+    def search(self, query, provider=None, start=None, end=None, offset=0, limit=20):
+        """BM25-ranked matches, best first, with titles weighted over bodies
+
+        Every word of the query must match (after stemming). Only the newest
+        SEARCH_RANK_WINDOW matches are ranked. Returns (results, has_more).
+        """
+        terms = re.findall(r"\w+", query.lower())
+        if not terms:
+            return [], False
+        match = " ".join(f'"{term}"' for term in terms)
+        filters = ""
+        params = [match]
+        if provider:
+            filters += " AND docs.provider = ?"
+            params.append(provider)
+        if start is not None:
+            filters += " AND docs.published >= ?"
+            params.append(start)
+        if end is not None:
+            filters += " AND docs.published < ?"
+            params.append(end)
+        matches = " FROM search JOIN docs ON docs.rowid = search.rowid WHERE search MATCH ?" + filters
+        # Rowids grow with insertion, so walking them backwards finds the newest
+        # matches without scoring anything; BM25 only runs over that window
+        ranked = (
+            "SELECT search.rowid, bm25(search, 4.0, 1.0) AS score" + matches +
+            " AND search.rowid >= coalesce((SELECT search.rowid" + matches +
+            " ORDER BY search.rowid DESC LIMIT 1 OFFSET ?), 0) ORDER BY score LIMIT ? OFFSET ?"
+        )
+        with self.lock:
+            top = self.db.execute(ranked, params + params + [SEARCH_RANK_WINDOW, limit + 1, offset]).fetchall()
+            # Snippets are only worth building for the page being returned
+            rows = self.db.execute(
+                "SELECT search.rowid, docs.id, docs.provider, docs.url, docs.published, search.title,"
+                " snippet(search, 1, '', '', ' ... ', 24) FROM search JOIN docs ON docs.rowid = search.rowid"
+                f" WHERE search MATCH ? AND search.rowid IN ({', '.join('?' * len(top))})",
+                [match] + [rowid for rowid, _ in top],
+            ).fetchall()
+        self.stats["queries"] += 1
+        found = {row[0]: row[1:] for row in rows}
+        results = []
+        for rowid, score in top[:limit]:
+            doc_id, doc_provider, url, published, title, snippet = found[rowid]
+            results.append({
+                "id": doc_id,
+                "provider": doc_provider,
+                "title": title,
+                "url": url,
+                "published": published,
+                "date": datetime.fromtimestamp(published, timezone.utc).isoformat() if published else "",
+                "snippet": snippet,
+                "score": round(-score, 4),
+            })
+        return results, len(top) > limit
+
+    def info(self):
+        with self.lock:
+            count = self.db.execute("SELECT COUNT(*) FROM docs").fetchone()[0]
+        return {"documents": count, **self.stats}
+
+    def close(self):
+        with self.lock:
+            self.db.close()
+
+search_index = None
+
+@asynccontextmanager
+async def lifespan(app):
+    global bloomberg_poller, article_cache, search_index, article_queue, prefetch_semaphore, upstream_usage
+    # Warm up one client per upstream so the first request skips client setup
+    for host in (RAPIDAPI_HOST, SEEKING_ALPHA_HOST, APIFY_HOST):
+        get_client(host)
+    budgeted = [limiter for limiter in limiters.values() if limiter.daily_budget or limiter.monthly_budget]
+    prefetching = ARTICLE_PREFETCH_TOP_N > 0 and APIFY_API_TOKEN
+    if UPSTREAM_USAGE_PATH and (budgeted or prefetching):
+        upstream_usage = UpstreamUsage(UPSTREAM_USAGE_PATH)
+        for limiter in budgeted:
+            limiter.load(upstream_usage)
+    if ARTICLE_CACHE_PATH:
+        article_cache = ArticleCache(ARTICLE_CACHE_PATH, ARTICLE_CACHE_MAX_BYTES)
+    if SEARCH_INDEX_PATH:
+        search_index = SearchIndex(SEARCH_INDEX_PATH)
+    article_queue = asyncio.Queue()
+    prefetch_semaphore = asyncio.Semaphore(ARTICLE_PREFETCH_CONCURRENCY)
+    workers = [asyncio.create_task(article_worker()) for _ in range(ARTICLE_WORKERS)]
+    if BLOOMBERG_POLL_INTERVAL > 0 and RAPIDAPI_KEY:
+        bloomberg_poller = asyncio.create_task(poll_bloomberg_feed())
+    if int(os.environ.get("WEB_CONCURRENCY", "1")) > 1:
+        logger.warning("Several workers: article jobs and since-cursors are per worker, "
+                       "so job polls and deltas fail whenever a request reaches another one")
+    yield
+    for worker in workers:
+        worker.cancel()
+    if bloomberg_poller is not None:
+        bloomberg_poller.cancel()
+        bloomberg_poller = None
+    for task in list(refresh_tasks) + list(prefetch_tasks):
+        task.cancel()
+    # Indexing runs in threads, which can't be cancelled; let it finish before closing
+    if index_tasks:
+        await asyncio.gather(*index_tasks, return_exceptions=True)
+    if article_cache is not None:
+        article_cache.close()
+        article_cache = None
+    if search_index is not None:
+        search_index.close()
+        search_index = None
+    await close_clients()
+    if upstream_usage is not None:
+        for limiter in limiters.values():
+            limiter.usage = None
+        upstream_usage.close()
+        upstream_usage = None
+
+def negotiate_encoding(request, available):
+    """Pick the best of available (in server preference order) that Accept-Encoding allows
+
+    Returns None when the body should go out uncompressed.
+    """
+    accepted = {}
+    for part in request.headers.get("accept-encoding", "").split(","):
+        name, _, params = part.partition(";")
+        params = params.strip()
+        q = 1.0
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip().lower()] = q
+    best, best_q = None, 0.0
+    for name in available:
+        q = accepted.get(name, accepted.get("*", 0.0))
+        if q > best_q:
+            best, best_q = name, q
+    return best
+
+# Encodings the proxy can produce, in server preference order
+COMPRESSION_ENCODINGS = [name for name, module in (("br", brotli), ("zstd", zstandard), ("gzip", gzip))
+                         if module is not None]
+compression_stats = {"compressed": 0, "prebuilt": 0, "prebuilt_reused": 0}
+
+def compress_body(body, encoding, levels=COMPRESSION_LEVELS):
+    if encoding == "br":
+        return brotli.compress(body, quality=levels["br"])
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=levels["zstd"]).compress(body)
+    return gzip.compress(body, compresslevel=levels["gzip"], mtime=0)
+
+def render_json(content):
+    """Serialize content to compact UTF-8 JSON, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered through render_json"""
+
+    def render(self, content):
+        return render_json(content)
+
+class EncodedBody:
+    """A serialized response body whose compressed variants are built on first use and kept"""
+
+    def __init__(self, body, media_type="application/json"):
+        self.body = body
+        self.media_type = media_type
+        self.variants = {}
+
+    def response(self, request, headers=None):
+        headers = {**(headers or {}), "Vary": "Accept-Encoding"}
+        encoding = None
+        if len(self.body) >= COMPRESSION_MIN_SIZE:
+            encoding = negotiate_encoding(request, COMPRESSION_ENCODINGS)
+        if encoding is None:
+            return Response(self.body, media_type=self.media_type, headers=headers)
+        variant = self.variants.get(encoding)
+        if variant is None:
+            variant = self.variants[encoding] = compress_body(self.body, encoding, PREBUILT_COMPRESSION_LEVELS)
+            compression_stats["prebuilt"] += 1
+        else:
+            compression_stats["prebuilt_reused"] += 1
+        headers["Content-Encoding"] = encoding
+        if "ETag" in headers:
+            headers["ETag"] = variant_etag(headers["ETag"], encoding)
+        return Response(variant, media_type=self.media_type, headers=headers)
+
+class CompressionMiddleware:
+    """Compress response bodies with the best encoding the client accepts
+
+    Bodies that already carry a Content-Encoding (prebuilt feeds, terminal
+    pages) and event streams pass through untouched. A compressed body's
+    ETag gets the encoding appended, and a 304 echoes back whichever
+    variant's tag the client revalidated with.
+    """
+
+    def __init__(self, app, minimum_size=COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not COMPRESSION_ENCODINGS:
+            await self.app(scope, receive, send)
+            return
+        request = Request(scope)
+        encoding = negotiate_encoding(request, COMPRESSION_ENCODINGS)
+        start = None
+        chunks = []
+        
+        async def send_compressed(message):
+            nonlocal start
+            if message["type"] == "http.response.start":
+                headers = MutableHeaders(scope=message)
+                if message["status"] == 304 and "etag" in headers:
+                    for tag, identity in if_none_match(request):
+                        if identity == headers["etag"]:
+                            headers["ETag"] = tag
+                            break
+                if "content-encoding" in headers or headers.get("content-type", "").startswith("text/event-stream"):
+                    await send(message)
+                    return
+                if "accept-encoding" not in headers.get("vary", "").lower():
+                    headers.add_vary_header("Accept-Encoding")
+                if encoding is None:
+                    await send(message)
+                    return
+                # Hold the start until the whole body is known
+                start = message
+                return
+            if start is None or message["type"] != "http.response.body":
+                await send(message)
+                return
+            chunks.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+            body = b"".join(chunks)
+            if len(body) >= self.minimum_size:
+                compressed = compress_body(body, encoding)
+                if len(compressed) < len(body):
+                    headers = MutableHeaders(scope=start)
+                    headers["Content-Encoding"] = encoding
+                    headers["Content-Length"] = str(len(compressed))
+                    if "etag" in headers:
+                        headers["ETag"] = variant_etag(headers["etag"], encoding)
+                    body = compressed
+                    compression_stats["compressed"] += 1
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+        
+        await self.app(scope, receive, send_compressed)
+
+app = FastAPI(title="Bloomberg News Proxy", lifespan=lifespan, default_response_class=FastJSONResponse)
+
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=["*"],
+    allow_methods=["*"],
+    allow_headers=["*"],
+)
+app.add_middleware(CompressionMiddleware)
+
 # Widget configuration for OpenBB Workspace - using markdown for clickable links
 WIDGETS_CONFIG = {
     "bloomberg_terminal_markets": {
@@ -100,14 +1408,119 @@ WIDGETS_CONFIG = {
     }
 }
 
+# Compressed bodies differ byte for byte from the identity one, so each
+# encoding gets its own strong ETag: the identity tag with "-<encoding>"
+ETAG_ENCODING_SUFFIX = re.compile(r'-(?:br|zstd|gzip)"$')
+
+def variant_etag(etag, encoding):
+    if not etag or not encoding or not etag.startswith('"'):
+        return etag
+    return f'{etag[:-1]}-{encoding}"'
+
+def if_none_match(request):
+    """The If-None-Match tags, each paired with the identity tag it stands for"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return []
+    tags = [tag.strip().removeprefix("W/") for tag in header.split(",")]
+    return [(tag, ETAG_ENCODING_SUFFIX.sub('"', tag)) for tag in tags]
+
+def etag_matches(request, etag):
+    """True if the request's If-None-Match already names etag or one of its encoded variants"""
+    return any(identity == etag or tag == "*" for tag, identity in if_none_match(request))
+
+def etag_headers(etag):
+    # Clients may keep the body but must revalidate before reusing it
+    return {"ETag": etag, "Cache-Control": "no-cache"}
+
+def not_modified(etag):
+    return Response(status_code=304, headers=etag_headers(etag))
+
+def set_etag(response, etag):
+    response.headers.update(etag_headers(etag))
+
+class StaticPage:
+    """An HTML page rendered once, with precompressed variants and a content-hash ETag"""
+
+    def __init__(self, html):
+        self.body = html.encode()
+        self.etag = '"%s"' % hashlib.sha256(self.body).hexdigest()[:32]
+        self.variants = {"gzip": gzip.compress(self.body, compresslevel=9, mtime=0)}
+        if brotli is not None:
+            self.variants["br"] = brotli.compress(self.body, quality=11)
+        self.encodings = [name for name in ("br", "gzip") if name in self.variants]
+
+    def response(self, request):
+        headers = {
+            "ETag": self.etag,
+            "Cache-Control": f"public, max-age={TERMINAL_CACHE_MAX_AGE}",
+            "Vary": "Accept-Encoding",
+        }
+        if etag_matches(request, self.etag):
+            return Response(status_code=304, headers=headers)
+        encoding = negotiate_encoding(request, self.encodings)
+        if encoding is None:
+            return Response(self.body, media_type="text/html; charset=utf-8", headers=headers)
+        headers["Content-Encoding"] = encoding
+        headers["ETag"] = variant_etag(self.etag, encoding)
+        return Response(self.variants[encoding], media_type="text/html; charset=utf-8", headers=headers)
+
+WIDGETS_BODY = EncodedBody(render_json(WIDGETS_CONFIG))
+WIDGETS_ETAG = '"%s"' % hashlib.blake2b(WIDGETS_BODY.body, digest_size=16).hexdigest()
+
 @app.get("/widgets.json")
-async def get_widgets():
-    return JSONResponse(content=WIDGETS_CONFIG)
+async def get_widgets(request: Request):
+    if etag_matches(request, WIDGETS_ETAG):
+        return not_modified(WIDGETS_ETAG)
+    return WIDGETS_BODY.response(request, etag_headers(WIDGETS_ETAG))
 
 @app.get("/health")
 async def health():
     return {"status": "ok"}
 
+@app.get("/stats")
+async def get_stats():
+    """Runtime statistics for the upstream clients and caches"""
+    return {
+        "pool": pool_stats(),
+        "singleflight": {"inflight": len(inflight), **singleflight_stats},
+        "feed_cache": feed_cache.info(),
+        "upstream_limits": {host: limiter.info() for host, limiter in limiters.items()},
+        "circuit_breakers": {host: breaker.info() for host, breaker in breakers.items()},
+        "upstream_retries": retry_stats["retries"],
+        "hedging": {
+            "enabled": UPSTREAM_HEDGE,
+            **{f"{host}{path}": hedger.info() for (host, path), hedger in hedgers.items()},
+        },
+        "bloomberg_snapshot": {
+            "poller": bloomberg_poller is not None,
+            "fetched_at": bloomberg_snapshot.fetched_at if bloomberg_snapshot else None,
+            "stories": len(bloomberg_snapshot.stories) if bloomberg_snapshot else 0,
+            "stored": bloomberg_store.counts(),
+            "store_evictions": bloomberg_store.evictions,
+        },
+        "article_cache": await asyncio.to_thread(article_cache.info) if article_cache else None,
+        "search_index": await asyncio.to_thread(search_index.info) if search_index else None,
+        "seekingalpha_bodies": {"lazy": SEEKINGALPHA_LAZY_BODIES, **seekingalpha_bodies.info()},
+        "article_jobs": {
+            "jobs": len(article_jobs),
+            "in_flight": len(article_jobs_by_url),
+            "queued": article_queue.qsize() if article_queue else 0,
+            "workers": ARTICLE_WORKERS,
+        },
+        "streams": {
+            channel.name: len(channel.subscribers)
+            for channel in [bloomberg_channel, benzinga_channel, *seekingalpha_channels.values()]
+        },
+        "article_prefetch": {
+            "top_n": ARTICLE_PREFETCH_TOP_N,
+            "daily_budget": ARTICLE_PREFETCH_DAILY_BUDGET,
+            "pending": len(prefetch_tasks),
+            **prefetch_stats,
+        },
+        "compression": {"encodings": COMPRESSION_ENCODINGS, **compression_stats},
+    }
+
 def format_timestamp(ts):
     """Convert Unix timestamp to readable time"""
     try:
@@ -116,134 +1529,440 @@ def format_timestamp(ts):
     except:
         return ""
 
+# Filter by category (matched against primarySite); a JSON file of
+# {"category": ["primarySite alias", ...]} in BLOOMBERG_CATEGORIES_FILE replaces these
+DEFAULT_BLOOMBERG_CATEGORIES = {
+    "markets": ["markets", "stocks", "currencies"],
+    "technology": ["technology", "tech"],
+    "politics": ["politics", "government"],
+    "industries": ["industries", "energy", "health"],
+    "wealth": ["wealth", "personal-finance"]
+}
+
+def load_bloomberg_categories(path):
+    if not path:
+        return DEFAULT_BLOOMBERG_CATEGORIES
+    with open(path) as f:
+        categories = {name.lower(): [alias.lower() for alias in aliases] for name, aliases in json.load(f).items()}
+    if "all" in categories:
+        raise ValueError(f"{path}: \"all\" is reserved for the unfiltered feed")
+    return categories
+
+BLOOMBERG_CATEGORIES = load_bloomberg_categories(os.environ.get("BLOOMBERG_CATEGORIES_FILE", ""))
+
+class Story:
+    """One news story, whatever the provider, reduced to the fields the endpoints use
+
+    Upstream story dicts carry dozens of fields; only these are kept once a
+    payload has been normalized. text is a provider's summary or stripped
+    body: None when a body exists but was left unparsed, "" when there is none.
+    """
+
+    __slots__ = ("id", "published", "title", "url", "site", "tickers", "thumbnail", "text")
+
+    def __init__(self, id, published, title, url, site="", tickers=(), thumbnail="", text=""):
+        self.id = id
+        self.published = published
+        self.title = title
+        self.url = url
+        self.site = site
+        self.tickers = tickers
+        self.thumbnail = thumbnail
+        self.text = text
+
+    def __repr__(self):
+        return f"Story({self.id!r}, {self.published!r}, {self.title!r})"
+
+class BloombergAdapter:
+    """news/list payloads: stories spread over modules, Unix timestamps"""
+
+    provider = "bloomberg"
+
+    def items(self, data):
+        if not (data.get("status") and data.get("data")):
+            return []
+        return [story for module in data["data"].get("modules", []) for story in module.get("stories", [])]
+
+    def story(self, item):
+        try:
+            published = int(item.get("published") or 0)
+        except (TypeError, ValueError):
+            published = 0
+        return Story(
+            item.get("id", item.get("internalID", item.get("title", ""))),
+            published,
+            item.get("title", item.get("headline", "")),
+            item.get("url", item.get("shortURL", "")),
+            site=item.get("primarySite", ""),
+            thumbnail=item.get("thumbnailImage", item.get("image", "")),
+            text=item.get("summary") or "",
+        )
+
+class SeekingAlphaAdapter:
+    """news/list and news/v2/list payloads: JSON:API articles with tickers under included
+
+    Unless lazy, article HTML is stripped to text here; lazy leaves text
+    None for articles that have a body.
+    """
+
+    provider = "seekingalpha"
+
+    def __init__(self, lazy=False):
+        self.lazy = lazy
+        self.tags = {}
+
+    def items(self, data):
+        # Get included tickers for symbol lookup
+        self.tags = {item["id"]: item.get("attributes", {}).get("name", "")
+                     for item in data.get("included", []) if item.get("type") == "tag"}
+        return data.get("data", [])
+
+    def story(self, item):
+        attrs = item.get("attributes", {})
+        content = attrs.get("content", "")
+        try:
+            published = parse_time(attrs.get("publishOn") or "")
+        except ValueError:
+            published = 0
+        tickers = item.get("relationships", {}).get("primaryTickers", {}).get("data", [])
+        return Story(
+            item.get("id", ""),
+            published,
+            attrs.get("title", ""),
+            f"https://seekingalpha.com{item.get('links', {}).get('self', '')}",
+            tickers=tuple(self.tags[t.get("id")] for t in tickers[:3] if self.tags.get(t.get("id"))),
+            text=None if self.lazy and content else html_to_text(content),
+        )
+
+def normalize_stories(adapter, data):
+    """Stories of an upstream payload, deduplicated by id and newest first"""
+    seen_ids = set()
+    stories = []
+    for item in adapter.items(data):
+        story = adapter.story(item)
+        if story.id and story.id not in seen_ids:
+            seen_ids.add(story.id)
+            stories.append(story)
+    stories.sort(key=lambda story: story.published, reverse=True)
+    return stories
+
+bloomberg_adapter = BloombergAdapter()
+
+@functools.lru_cache(maxsize=1024)
+def site_categories(site):
+    """Categories of BLOOMBERG_CATEGORIES whose aliases match a primarySite"""
+    return tuple(category for category, allowed in BLOOMBERG_CATEGORIES.items()
+                 if site in allowed or any(a in site for a in allowed))
+
+def story_categories(story):
+    return site_categories(story.site.lower())
+
+def format_story(story):
+    return {
+        "time": format_timestamp(story.published) if story.published else "",
+        "headline": story.title,
+        "category": (story.site or "NEWS").upper(),
+        "url": story.url,
+        "thumbnail": story.thumbnail,
+    }
+
+def build_stories_payload(formatted_results, cursor):
+    return {
+        "results": formatted_results,
+        "provider": "bloomberg",
+        "warnings": None,
+        "chart": None,
+        "extra": {"metadata": {"route": "/stories/list", "count": len(formatted_results), "cursor": cursor}}
+    }
+
+def build_markdown_payload(items):
+    # Build Bloomberg Terminal style markdown
+    lines = ["## BLOOMBERG LATEST NEWS", "---"]
+    
+    for story in items[:20]:
+        item = format_story(story)
+        # Format: TIME | CATEGORY | [HEADLINE](URL)
+        lines.append(f"**{item['time']}** | `{item['category']}` | [{item['headline']}]({item['url']})")
+        lines.append("")
+    
+    markdown_content = "\n".join(lines)
+    
+    return {
+        "results": [{"markdown_content": markdown_content}],
+        "provider": "bloomberg",
+        "warnings": None,
+        "chart": None,
+        "extra": {"metadata": {"route": "/news/markdown", "count": len(items)}}
+    }
+
+class StoryIndex:
+    """Stories in arrival order, each stamped with a sequence number clients use as a since cursor
+
+    Within one ingest, older stories get lower numbers, so the newest story
+    always carries the current cursor. Only the latest max_items are kept.
+    Cursors read "<epoch>:<seq>"; the epoch is new for every index, so a
+    cursor from before a restart or from an evicted index is never misread.
+    """
+
+    def __init__(self, max_items=5000):
+        self.max_items = max_items
+        self.epoch = uuid.uuid4().hex[:8]
+        self.seq = 0
+        self.seqs = []
+        self.items = []
+        self.ids = set()
+
+    @property
+    def cursor(self):
+        return f"{self.epoch}:{self.seq}"
+
+    def ingest(self, items):
+        """Add the unseen items of a newest-first list; returns the new cursor"""
+        new_items = [item for item in items if item["id"] not in self.ids]
+        for item in reversed(new_items):
+            self.seq += 1
+            self.seqs.append(self.seq)
+            self.items.append(item)
+            self.ids.add(item["id"])
+        overflow = len(self.items) - self.max_items
+        if overflow > 0:
+            for item in self.items[:overflow]:
+                self.ids.discard(item["id"])
+            del self.seqs[:overflow]
+            del self.items[:overflow]
+        return self.cursor
+
+    def position(self, cursor):
+        """Sequence number of a cursor, or None if it isn't from this index or predates what is kept"""
+        epoch, _, seq = cursor.partition(":")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+        seq = int(seq)
+        if seq > self.seq or (self.seqs and seq < self.seqs[0] - 1):
+            return None
+        return seq
+
+    def since(self, cursor, limit=None, select=None):
+        """The oldest limit items selected after cursor, newest first
+
+        Returns the items, the cursor to poll from next (that of the newest
+        item returned) and whether selected items are left after them.
+        """
+        start = bisect.bisect_right(self.seqs, self.position(cursor))
+        items = []
+        end = start
+        while end < len(self.items) and (limit is None or len(items) < limit):
+            if select is None or select(self.items[end]):
+                items.append(self.items[end])
+            end += 1
+        rest = self.items[end:]
+        has_more = any(map(select, rest)) if select is not None else bool(rest)
+        if end > start:
+            cursor = f"{self.epoch}:{self.seqs[end - 1]}"
+        return items[::-1], cursor, has_more
+
+bloomberg_index = StoryIndex()
+
+class StoryStore:
+    """Bloomberg stories merged across fetches, ordered by published time
+
+    Stories are deduplicated by id and a story seen again replaces
+    its earlier copy. Categories are resolved once, when a story is
+    merged, into one ordered index per category, so a category page is a
+    slice like the unfiltered one. Past max_items the oldest stories are
+    evicted, so pages reach back beyond the current upstream window
+    without any extra upstream calls.
+    """
+
+    def __init__(self, max_items=5000):
+        self.max_items = max_items
+        # (published, id) in ascending order, so the newest story is last
+        self.keys = []
+        self.by_category = {category: [] for category in BLOOMBERG_CATEGORIES}
+        self.stories = {}
+        self.entries = {}
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.keys)
+
+    def index(self, key, categories):
+        bisect.insort(self.keys, key)
+        for category in categories:
+            bisect.insort(self.by_category[category], key)
+
+    def unindex(self, key, categories):
+        for keys in [self.keys] + [self.by_category[category] for category in categories]:
+            del keys[bisect.bisect_left(keys, key)]
+
+    def merge(self, stories):
+        """Fold normalized stories into the store; returns how many were new"""
+        added = 0
+        for story in stories:
+            item_id = story.id
+            if not item_id:
+                continue
+            entry = ((story.published, item_id), story_categories(story))
+            old = self.entries.get(item_id)
+            if old is None:
+                added += 1
+            elif old != entry:
+                self.unindex(*old)
+            if old != entry:
+                self.index(*entry)
+                self.entries[item_id] = entry
+            self.stories[item_id] = story
+        overflow = len(self.keys) - self.max_items
+        if overflow > 0:
+            for key in self.keys[:overflow]:
+                self.unindex(*self.entries.pop(key[1]))
+                del self.stories[key[1]]
+            self.evictions += overflow
+        return added
+
+    def page(self, offset=0, limit=20, category=None):
+        """Stories newest first, optionally only those of one category"""
+        keys = self.keys if category is None else self.by_category.get(category, [])
+        end = max(len(keys) - offset, 0)
+        return [self.stories[item_id] for _, item_id in reversed(keys[max(end - limit, 0):end])]
+
+    def counts(self):
+        return {"all": len(self.keys), **{category: len(keys) for category, keys in self.by_category.items()}}
+
+bloomberg_store = StoryStore(BLOOMBERG_STORE_MAX_STORIES)
+
+class FeedSnapshot:
+    """Every Bloomberg view prebuilt from one news/list payload"""
+
+    def __init__(self, data, digest):
+        self.data = data
+        self.fetched_at = time.time()
+        self.stories = normalize_stories(bloomberg_adapter, data)
+        # Formatted stories tagged with id and categories, as pushed to stream subscribers
+        self.feed_items = [{"id": story.id, "categories": list(story_categories(story)), **format_story(story)}
+                           for story in self.stories]
+        self.cursor = bloomberg_index.ingest(self.feed_items)
+        bloomberg_store.merge(self.stories)
+        # First pages come from the store, so they include stories that left the upstream window
+        self.views = {"all": build_stories_payload([format_story(item) for item in bloomberg_store.page()], self.cursor)}
+        for category in BLOOMBERG_CATEGORIES:
+            items = bloomberg_store.page(category=category)
+            self.views[category] = build_stories_payload([format_story(item) for item in items], self.cursor)
+        self.markdown = build_markdown_payload(bloomberg_store.page())
+        # Every view is a pure function of the upstream body and the cursor
+        self.etag = f"{digest}-{self.cursor}"
+        # Ready-to-send bodies; compressed variants are added on first request
+        self.bodies = {name: EncodedBody(render_json(view)) for name, view in self.views.items()}
+        self.bodies["markdown"] = EncodedBody(render_json(self.markdown))
+
+    def view_name(self, category):
+        # Unknown categories are not filtered, same as "all"
+        return category.lower() if category.lower() in self.views else "all"
+
+    def view(self, category):
+        return self.views[self.view_name(category)]
+
+bloomberg_snapshot = None
+bloomberg_poller = None
+
+def set_bloomberg_snapshot(data, digest):
+    """Build a snapshot off to the side, then swap the reference in one step"""
+    global bloomberg_snapshot
+    bloomberg_snapshot = FeedSnapshot(data, digest)
+    bloomberg_channel.publish(bloomberg_snapshot.feed_items)
+    schedule_prefetch(bloomberg_snapshot)
+    schedule_indexing([bloomberg_document(story) for story in bloomberg_snapshot.stories])
+    return bloomberg_snapshot
+
+async def get_bloomberg_snapshot():
+    """Return the current Bloomberg snapshot, building one on demand if the poller hasn't"""
+    if bloomberg_poller is not None and bloomberg_snapshot is not None:
+        return bloomberg_snapshot
+    data, digest = await fetch_feed("bloomberg", RAPIDAPI_HOST, "/news/list")
+    # The feed cache hands back the same object until it refreshes, so only rebuild on change
+    if bloomberg_snapshot is None or bloomberg_snapshot.data is not data:
+        return set_bloomberg_snapshot(data, digest)
+    return bloomberg_snapshot
+
+async def poll_bloomberg_feed():
+    """Refresh the Bloomberg snapshot every BLOOMBERG_POLL_INTERVAL seconds"""
+    key = request_key(RAPIDAPI_HOST, "/news/list")
+    while True:
+        try:
+            entry = await feed_cache.load(key)
+            # With a shared cache, another worker may already have polled this round
+            if entry is not None and time.time() - entry[1] < BLOOMBERG_POLL_INTERVAL:
+                data, digest = entry[0]
+            else:
+                data, digest = await fetch_json(RAPIDAPI_HOST, "/news/list")
+                await feed_cache.store(key, (data, digest))
+            if bloomberg_snapshot is None or bloomberg_snapshot.data is not data:
+                set_bloomberg_snapshot(data, digest)
+        except Exception as e:
+            logger.warning("Bloomberg feed poll failed: %s", e)
+        await asyncio.sleep(BLOOMBERG_POLL_INTERVAL)
+
 @app.get("/stories/list")
-async def get_stories_list(id: str = Query("markets", description="Category (not used - returns all latest news)")):
+async def get_stories_list(
+    request: Request,
+    response: Response,
+    id: str = Query("markets", description="Category (not used - returns all latest news)"),
+    since: Optional[str] = Query(None, description="Cursor from a previous response; only newer stories are returned"),
+    offset: int = Query(0, ge=0, description="Stories to skip, for paging back through stored stories"),
+    limit: int = Query(20, ge=1, le=200, description="Stories per page"),
+):
     """Get stories/news - formatted for Bloomberg Terminal style"""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"https://{RAPIDAPI_HOST}/news/list",
-            headers=headers,
-            timeout=30.0
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=response.text)
-        
-        data = response.json()
-        
-        # Extract stories from all modules in the new API format
-        all_stories = []
-        if data.get("status") and data.get("data"):
-            modules = data["data"].get("modules", [])
-            for module in modules:
-                stories = module.get("stories", [])
-                all_stories.extend(stories)
-        
-        # Deduplicate by ID
-        seen_ids = set()
-        unique_items = []
-        for item in all_stories:
-            item_id = item.get("id", item.get("internalID", item.get("title", "")))
-            if item_id and item_id not in seen_ids:
-                seen_ids.add(item_id)
-                unique_items.append(item)
-        
-        # Sort by timestamp descending (newest first)
-        unique_items.sort(key=lambda x: x.get("published", 0), reverse=True)
-        
-        # Filter by category if specified (client-side filtering)
-        category_map = {
-            "markets": ["markets", "stocks", "currencies"],
-            "technology": ["technology", "tech"],
-            "politics": ["politics", "government"],
-            "industries": ["industries", "energy", "health"],
-            "wealth": ["wealth", "personal-finance"]
-        }
-        
-        if id.lower() in category_map:
-            allowed = category_map[id.lower()]
-            unique_items = [item for item in unique_items 
-                          if item.get("primarySite", "").lower() in allowed 
-                          or any(a in item.get("primarySite", "").lower() for a in allowed)]
-        
-        formatted_results = []
-        for item in unique_items[:20]:
-            # Parse Unix timestamp
-            published = item.get("published", 0)
-            time_str = format_timestamp(published) if published else ""
-            
-            formatted_results.append({
-                "time": time_str,
-                "headline": item.get("title", item.get("headline", "")),
-                "category": item.get("primarySite", "NEWS").upper(),
-                "url": item.get("url", item.get("shortURL", "")),
-                "thumbnail": item.get("thumbnailImage", item.get("image", ""))
-            })
-        
-        return {
-            "results": formatted_results,
-            "provider": "bloomberg",
-            "warnings": None,
-            "chart": None,
-            "extra": {"metadata": {"route": "/stories/list", "count": len(formatted_results)}}
-        }
+    snapshot = await get_bloomberg_snapshot()
+    # A cursor from before a restart or older than the index can't be resolved, so fall back to the full list
+    if since is not None and bloomberg_index.position(since) is None:
+        since = None
+    
+    view = snapshot.view_name(id)
+    paged = offset != 0 or limit != 20
+    etag = f"{snapshot.etag}-{view}"
+    if since is not None:
+        etag += f"-{since}"
+    if paged:
+        etag += f"-{offset}-{limit}"
+    etag = f'"{etag}"'
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    if since is None and not paged:
+        return snapshot.bodies[view].response(request, etag_headers(etag))
+    set_etag(response, etag)
+    
+    if since is None:
+        items = bloomberg_store.page(offset, limit, None if view == "all" else view)
+        payload = build_stories_payload([format_story(item) for item in items], snapshot.cursor)
+        payload["extra"]["metadata"].update(offset=offset, stored=len(bloomberg_store))
+        return payload
+    
+    select = None if view == "all" else lambda item: view in item["categories"]
+    items, cursor, has_more = bloomberg_index.since(since, limit, select)
+    # Index items carry id and categories for stream subscribers; the list shape has neither
+    payload = build_stories_payload([{key: value for key, value in item.items() if key not in ("id", "categories")}
+                                     for item in items], cursor)
+    payload["extra"]["metadata"]["has_more"] = has_more
+    return payload
+
+@app.get("/stories/categories")
+async def get_story_categories():
+    """Configured Bloomberg categories and how many stored stories each has"""
+    return {"categories": BLOOMBERG_CATEGORIES, "stored": bloomberg_store.counts()}
 
 @app.get("/news/markdown")
-async def get_news_markdown(category: str = Query("markets", description="Category (returns all latest news)")):
+async def get_news_markdown(
+    request: Request,
+    response: Response,
+    category: str = Query("markets", description="Category (returns all latest news)"),
+):
     """Get news formatted as markdown with clickable links - Bloomberg Terminal style"""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"https://{RAPIDAPI_HOST}/news/list",
-            headers=headers,
-            timeout=30.0
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=response.text)
-        
-        data = response.json()
-        
-        # Extract stories from all modules
-        all_stories = []
-        if data.get("status") and data.get("data"):
-            modules = data["data"].get("modules", [])
-            for module in modules:
-                stories = module.get("stories", [])
-                all_stories.extend(stories)
-        
-        # Deduplicate and sort
-        seen_ids = set()
-        unique_items = []
-        for item in all_stories:
-            item_id = item.get("id", item.get("internalID", item.get("title", "")))
-            if item_id and item_id not in seen_ids:
-                seen_ids.add(item_id)
-                unique_items.append(item)
-        unique_items.sort(key=lambda x: x.get("published", 0), reverse=True)
-        
-        # Build Bloomberg Terminal style markdown
-        lines = ["## BLOOMBERG LATEST NEWS", "---"]
-        
-        for item in unique_items[:20]:
-            # Parse Unix timestamp
-            published = item.get("published", 0)
-            time_str = format_timestamp(published) if published else ""
-            
-            title = item.get("title", item.get("headline", ""))
-            url = item.get("url", item.get("shortURL", ""))
-            cat = item.get("primarySite", "NEWS").upper()
-            
-            # Format: TIME | CATEGORY | [HEADLINE](URL)
-            lines.append(f"**{time_str}** | `{cat}` | [{title}]({url})")
-            lines.append("")
-        
-        markdown_content = "\n".join(lines)
-        
-        return {
-            "results": [{"markdown_content": markdown_content}],
-            "provider": "bloomberg",
-            "warnings": None,
-            "chart": None,
-            "extra": {"metadata": {"route": "/news/markdown", "count": len(unique_items)}}
-        }
+    snapshot = await get_bloomberg_snapshot()
+    etag = f'"{snapshot.etag}-markdown"'
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    return snapshot.bodies["markdown"].response(request, etag_headers(etag))
 
 @app.get("/news/iframe")
 async def get_news_iframe():
@@ -253,67 +1972,457 @@ async def get_news_iframe():
 
 <iframe src="https://159.223.99.81/bloomberg/terminal" width="100%" height="600" frameborder="0"></iframe>
 
-*Click headlines to open full articles*
-"""
+*Click headlines to open full articles*
+"""
+    return {
+        "results": [{"markdown_content": iframe_html}],
+        "provider": "bloomberg",
+        "warnings": None,
+        "chart": None,
+        "extra": {"metadata": {"route": "/news/iframe"}}
+    }
+
+def parse_time(value):
+    """Epoch seconds from an epoch number or an ISO 8601 date/time (UTC unless it says otherwise)"""
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    moment = datetime.fromisoformat(value)
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return moment.timestamp()
+
+def bloomberg_document(story):
+    return {
+        # Keyed on the URL so a scraped article lands on its headline's document
+        "id": "bloomberg:" + (normalize_article_url(story.url) if story.url else story.id),
+        "provider": "bloomberg",
+        "title": story.title,
+        "body": story.text or "",
+        "url": story.url,
+        "published": story.published,
+    }
+
+def article_document(url, article):
+    try:
+        published = parse_time(article.get("date") or "")
+    except ValueError:
+        published = 0
     return {
-        "results": [{"markdown_content": iframe_html}],
+        "id": "bloomberg:" + normalize_article_url(url),
         "provider": "bloomberg",
-        "warnings": None,
-        "chart": None,
-        "extra": {"metadata": {"route": "/news/iframe"}}
+        "title": article.get("title", ""),
+        "body": article.get("content", ""),
+        "url": url,
+        "published": published,
     }
 
-@app.get("/article")
-async def get_full_article(url: str = Query(..., description="Bloomberg article URL")):
-    """Fetch full article content via Apify Bloomberg scraper"""
+def seekingalpha_document(story):
+    return {
+        "id": f"seekingalpha:{story.id}",
+        "provider": "seekingalpha",
+        "title": story.title,
+        "body": story.text or "",
+        "url": story.url,
+        "published": story.published,
+    }
+
+# Running indexing tasks, so shutdown can wait for them
+index_tasks = set()
+
+def schedule_indexing(docs):
+    """Index documents in a worker thread without holding up the caller"""
+    if search_index is None or not docs:
+        return
+    task = asyncio.ensure_future(asyncio.to_thread(search_index.add, docs))
+    index_tasks.add(task)
+    task.add_done_callback(index_tasks.discard)
+
+@app.get("/search")
+async def search_news(
+    q: str = Query(..., min_length=1, description="Words to search headlines and article bodies for"),
+    provider: Optional[str] = Query(None, description="Only this provider: bloomberg or seekingalpha"),
+    start: Optional[str] = Query(None, description="Published at or after: epoch seconds or ISO 8601"),
+    end: Optional[str] = Query(None, description="Published before: epoch seconds or ISO 8601"),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=100),
+):
+    """Full-text search over every ingested headline and scraped article, best matches first"""
+    if search_index is None:
+        raise HTTPException(status_code=503, detail="Search index disabled")
+    try:
+        start_at = parse_time(start) if start else None
+        end_at = parse_time(end) if end else None
+    except ValueError:
+        raise HTTPException(status_code=400, detail="start and end must be epoch seconds or ISO 8601")
+    results, has_more = await asyncio.to_thread(search_index.search, q, provider, start_at, end_at, offset, limit)
+    return {"results": results, "query": q, "offset": offset, "limit": limit, "has_more": has_more}
+
+async def scrape_article(url):
+    """Run the Apify Bloomberg scraper for one URL; returns None if it found no content"""
+    # Call Apify Bloomberg scraper synchronously
+    apify_url = f"https://api.apify.com/v2/acts/romy~bloomberg-news-scraper/run-sync-get-dataset-items?token={APIFY_API_TOKEN}"
+    
+    # Not retried: every run is billed
+    response = await send_upstream(
+        APIFY_HOST,
+        "POST",
+        apify_url,
+        json={"url": url},
+        timeout=120.0  # Apify can take time to scrape
+    )
+    
+    if response.status_code != 200:
+        raise HTTPException(status_code=response.status_code, detail=f"Apify error: {response.text}")
+    
+    data = response.json()
+    
+    if data and len(data) > 0:
+        article = data[0]
+        return {
+            "title": article.get("title", ""),
+            "subtitle": article.get("subtitle", ""),
+            "author": article.get("author", ""),
+            "date": article.get("date", ""),
+            "content": article.get("content", ""),
+            "images": article.get("images", []),
+            "url": url
+        }
+    return None
+
+class ArticleJob:
+    """One queued Apify scrape; finished jobs stay pollable for ARTICLE_JOB_TTL seconds"""
+
+    def __init__(self, url):
+        self.id = uuid.uuid4().hex
+        self.url = url
+        self.status = "queued"
+        self.article = None
+        self.error = None
+        self.error_status = None
+        self.error_headers = None
+        self.cached = False
+        self.finished_at = None
+        self.changed = asyncio.Event()
+        self.done = asyncio.Event()
+
+    def update(self, status, article=None, error=None, error_status=None, error_headers=None):
+        self.status = status
+        self.article = article
+        self.error = error
+        self.error_status = error_status
+        self.error_headers = error_headers
+        if status in ("done", "failed"):
+            self.finished_at = time.monotonic()
+            self.done.set()
+        # Wake everyone watching this job, then arm a fresh event for the next change
+        self.changed.set()
+        self.changed = asyncio.Event()
+
+    def to_dict(self):
+        result = {"job_id": self.id, "status": self.status, "url": self.url}
+        if self.status == "done":
+            result["article"] = self.article
+            result["cached"] = self.cached
+        elif self.status == "failed":
+            result["error"] = self.error
+            if self.error_headers and "Retry-After" in self.error_headers:
+                result["retry_after"] = int(self.error_headers["Retry-After"])
+        return result
+
+article_jobs = {}
+# Unfinished jobs by normalized URL, so repeat requests join the same scrape
+article_jobs_by_url = {}
+article_queue = None
+
+async def submit_article_job(url):
+    """Queue a scrape for url, reusing an in-flight job or a cached article"""
+    now = time.monotonic()
+    for job_id, job in list(article_jobs.items()):
+        if job.finished_at is not None and now - job.finished_at > ARTICLE_JOB_TTL:
+            del article_jobs[job_id]
+    
+    key = normalize_article_url(url)
+    job = article_jobs_by_url.get(key)
+    if job is not None:
+        return job
+    
+    job = ArticleJob(url)
+    article_jobs[job.id] = job
+    # Registered before the cache lookup awaits, so concurrent requests join this job
+    article_jobs_by_url[key] = job
+    # Published articles don't change, so a cached scrape is always good
+    if article_cache is not None:
+        article = await asyncio.to_thread(article_cache.get, url)
+        if article is not None:
+            release_article_job(key, job)
+            job.cached = True
+            job.update("done", article={**article, "url": url})
+            return job
+    
+    article_queue.put_nowait(job)
+    return job
+
+def release_article_job(key, job):
+    """Stop routing key to job, unless a newer job has taken the URL over"""
+    if article_jobs_by_url.get(key) is job:
+        del article_jobs_by_url[key]
+
+async def article_worker():
+    """Take jobs off the queue one at a time; ARTICLE_WORKERS of these bound Apify concurrency"""
+    while True:
+        job = await article_queue.get()
+        job.update("running")
+        try:
+            article = await scrape_article(job.url)
+            if article is None:
+                job.update("failed", error="No content returned")
+            else:
+                if article_cache is not None:
+                    await asyncio.to_thread(article_cache.put, job.url, article)
+                if search_index is not None:
+                    await asyncio.to_thread(search_index.add, [article_document(job.url, article)], fill=True)
+                job.update("done", article=article)
+        except httpx.TimeoutException:
+            job.update("failed", error="Request timed out - article may be too long", error_status=504)
+        except (UpstreamBudgetExceeded, UpstreamUnavailable) as e:
+            job.update("failed", error=e.detail, error_status=e.status_code, error_headers=e.headers)
+        except Exception as e:
+            job.update("failed", error=str(e), error_status=500)
+        finally:
+            release_article_job(normalize_article_url(job.url), job)
+            article_queue.task_done()
+
+# URLs already handed to the prefetcher, oldest first
+prefetched_urls = OrderedDict()
+# URLs with a prefetch waiting for its turn
+prefetch_pending = set()
+prefetch_stats = {"day": None, "scrapes_today": 0, "submitted": 0, "over_budget": 0}
+prefetch_tasks = set()
+prefetch_semaphore = None
+# Prefetch scrapes are counted in upstream_usage under this name, apart from Apify's own budget
+PREFETCH_USAGE_HOST = "apify-prefetch"
+
+def schedule_prefetch(snapshot):
+    """Queue the top stories of a snapshot that haven't been prefetched yet"""
+    if ARTICLE_PREFETCH_TOP_N <= 0 or not APIFY_API_TOKEN or article_queue is None:
+        return
+    for story in snapshot.stories[:ARTICLE_PREFETCH_TOP_N]:
+        url = story.url
+        if not url.startswith("https://www.bloomberg.com"):
+            continue
+        key = normalize_article_url(url)
+        if key in prefetched_urls or key in prefetch_pending:
+            continue
+        prefetch_pending.add(key)
+        task = asyncio.create_task(prefetch_article(url, key))
+        prefetch_tasks.add(task)
+        task.add_done_callback(prefetch_tasks.discard)
+
+async def take_prefetch_budget():
+    """Count one prefetch scrape against today's budget; False once it is used up"""
+    today = time.strftime("%Y-%m-%d", time.gmtime())
+    if prefetch_stats["day"] != today:
+        prefetch_stats["day"] = today
+        prefetch_stats["scrapes_today"] = 0
+    if upstream_usage is None or ARTICLE_PREFETCH_DAILY_BUDGET <= 0:
+        if prefetch_stats["scrapes_today"] >= ARTICLE_PREFETCH_DAILY_BUDGET:
+            return False
+        prefetch_stats["scrapes_today"] += 1
+        return True
+    taken, prefetch_stats["scrapes_today"], _ = await asyncio.to_thread(
+        upstream_usage.take, PREFETCH_USAGE_HOST, today, today[:7], ARTICLE_PREFETCH_DAILY_BUDGET, 0
+    )
+    return taken
+
+async def give_back_prefetch_budget():
+    day = prefetch_stats["day"]
+    prefetch_stats["scrapes_today"] = max(prefetch_stats["scrapes_today"] - 1, 0)
+    if upstream_usage is not None:
+        await asyncio.to_thread(upstream_usage.give_back, PREFETCH_USAGE_HOST, day, day[:7])
+
+async def prefetch_article(url, key):
+    # At most ARTICLE_PREFETCH_CONCURRENCY prefetches hold a worker, leaving the rest for clicks
+    try:
+        async with prefetch_semaphore:
+            # Refused URLs stay unmarked, so they are tried again once the budget resets
+            if not await take_prefetch_budget():
+                prefetch_stats["over_budget"] += 1
+                return
+            job = await submit_article_job(url)
+            prefetched_urls[key] = True
+            while len(prefetched_urls) > 1000:
+                prefetched_urls.popitem(last=False)
+            prefetch_stats["submitted"] += 1
+            if job.cached:
+                # Served from the article cache, so no scrape was spent
+                await give_back_prefetch_budget()
+            await job.done.wait()
+    finally:
+        prefetch_pending.discard(key)
+
+def validate_article_url(url):
     if not APIFY_API_TOKEN:
         raise HTTPException(status_code=500, detail="Apify API token not configured")
     
     if not url.startswith("https://www.bloomberg.com"):
         raise HTTPException(status_code=400, detail="Only Bloomberg URLs are supported")
-    
-    async with httpx.AsyncClient() as client:
-        # Call Apify Bloomberg scraper synchronously
-        apify_url = f"https://api.apify.com/v2/acts/romy~bloomberg-news-scraper/run-sync-get-dataset-items?token={APIFY_API_TOKEN}"
-        
+
+def sse_event(data, event=None):
+    """Format one Server-Sent Events message"""
+    prefix = f"event: {event}\n" if event else ""
+    return f"{prefix}data: {render_json(data).decode()}\n\n"
+
+# Keep nginx from buffering event streams
+SSE_HEADERS = {"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+
+class FeedChannel:
+    """Shared server-side state of one pushed news feed
+
+    Holds the latest items (newest first, each with an "id") and one queue
+    per stream subscriber. publish() pushes only items whose id wasn't in
+    the previous publish. While anyone is subscribed, a task calls refresh
+    every interval seconds; refresh is expected to end up in publish().
+    """
+
+    def __init__(self, name, refresh, interval):
+        self.name = name
+        self.refresh = refresh
+        self.interval = interval
+        self.items = None
+        self.ids = set()
+        self.subscribers = set()
+        self.task = None
+
+    def publish(self, items):
+        new_items = [item for item in items if item["id"] not in self.ids]
+        self.items = items
+        self.ids = {item["id"] for item in items}
+        if new_items:
+            for queue in self.subscribers:
+                queue.put_nowait(new_items)
+
+    async def load(self):
+        if self.items is None:
+            await self.refresh()
+
+    def subscribe(self):
+        queue = asyncio.Queue()
+        self.subscribers.add(queue)
+        if self.task is None:
+            self.task = asyncio.create_task(self.run())
+        return queue
+
+    def unsubscribe(self, queue):
+        self.subscribers.discard(queue)
+        if not self.subscribers and self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    async def run(self):
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.refresh()
+            except Exception as e:
+                logger.warning("Refresh of %s stream failed: %s", self.name, e)
+
+def stream_channel(channel, select=lambda item: True, limit=20, on_close=None):
+    """Server-Sent Events response: a snapshot of the channel, then deltas as they arrive"""
+    async def events():
         try:
-            response = await client.post(
-                apify_url,
-                json={"url": url},
-                timeout=120.0  # Apify can take time to scrape
-            )
-            
-            if response.status_code != 200:
-                raise HTTPException(status_code=response.status_code, detail=f"Apify error: {response.text}")
-            
-            data = response.json()
-            
-            if data and len(data) > 0:
-                article = data[0]
-                return {
-                    "success": True,
-                    "article": {
-                        "title": article.get("title", ""),
-                        "subtitle": article.get("subtitle", ""),
-                        "author": article.get("author", ""),
-                        "date": article.get("date", ""),
-                        "content": article.get("content", ""),
-                        "images": article.get("images", []),
-                        "url": url
-                    }
-                }
-            else:
-                return {"success": False, "error": "No content returned"}
-                
-        except httpx.TimeoutException:
-            raise HTTPException(status_code=504, detail="Request timed out - article may be too long")
+            await channel.load()
+            error = None
         except Exception as e:
-            raise HTTPException(status_code=500, detail=str(e))
+            error = str(e)
+        queue = channel.subscribe()
+        try:
+            if error is None:
+                yield sse_event({"results": [item for item in channel.items if select(item)][:limit]}, event="snapshot")
+            else:
+                # Whatever the background refresh finds later arrives as a delta
+                yield sse_event({"error": error}, event="error")
+            while True:
+                try:
+                    items = await asyncio.wait_for(queue.get(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+                    continue
+                items = [item for item in items if select(item)][:limit]
+                if items:
+                    yield sse_event({"results": items}, event="delta")
+        finally:
+            channel.unsubscribe(queue)
+            if on_close is not None:
+                on_close()
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
 
-@app.get("/terminal", response_class=HTMLResponse)
-async def bloomberg_terminal():
-    """Full Bloomberg Terminal HTML page with article modal"""
-    html = """
+bloomberg_channel = FeedChannel("bloomberg", lambda: get_bloomberg_snapshot(), FEED_TTLS["bloomberg"])
+
+@app.get("/stories/stream")
+async def stream_stories(category: str = Query("all", description="Category to push")):
+    """Push new Bloomberg stories as Server-Sent Events instead of polling /stories/list"""
+    category = category.lower()
+    if category in BLOOMBERG_CATEGORIES:
+        return stream_channel(bloomberg_channel, lambda item: category in item["categories"])
+    return stream_channel(bloomberg_channel)
+
+@app.get("/article")
+async def get_full_article(url: str = Query(..., description="Bloomberg article URL")):
+    """Fetch full article content via Apify Bloomberg scraper"""
+    validate_article_url(url)
+    
+    job = await submit_article_job(url)
+    await job.done.wait()
+    
+    if job.status == "done":
+        result = {"success": True, "article": job.article}
+        if job.cached:
+            result["cached"] = True
+        return result
+    if job.error_status:
+        raise HTTPException(status_code=job.error_status, detail=job.error, headers=job.error_headers)
+    return {"success": False, "error": job.error}
+
+@app.post("/article/jobs", status_code=202)
+async def create_article_job(url: str = Query(..., description="Bloomberg article URL")):
+    """Queue an article scrape and return its job id right away"""
+    validate_article_url(url)
+    job = await submit_article_job(url)
+    return job.to_dict()
+
+@app.get("/article/jobs/{job_id}")
+async def get_article_job(job_id: str):
+    """Poll an article scrape job"""
+    job = article_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown job")
+    return job.to_dict()
+
+@app.get("/article/jobs/{job_id}/stream")
+async def stream_article_job(job_id: str):
+    """Stream an article scrape job's status changes as Server-Sent Events"""
+    job = article_jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Unknown job")
+    
+    async def events():
+        while True:
+            changed = job.changed
+            yield sse_event(job.to_dict(), event=job.status)
+            if job.done.is_set():
+                return
+            while not changed.is_set():
+                try:
+                    await asyncio.wait_for(changed.wait(), timeout=15)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n"
+    
+    return StreamingResponse(events(), media_type="text/event-stream", headers=SSE_HEADERS)
+
+BLOOMBERG_TERMINAL_HTML = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -577,43 +2686,58 @@ async def bloomberg_terminal():
     
     <script>
         let currentCategory = 'all';
+        let newsStream = null;
+        
+        function storyHtml(item) {
+            const encodedUrl = encodeURIComponent(item.url);
+            return `
+                <div class="news-item">
+                    <span class="time">${item.time}</span>
+                    <span class="category">${item.category}</span>
+                    <span class="headline">${item.headline}</span>
+                    <button class="read-btn" onclick="openArticle('${encodedUrl}', event)">READ</button>
+                </div>
+            `;
+        }
         
-        async function loadNews(category) {
+        function loadNews(category) {
             currentCategory = category;
-            document.querySelectorAll('.tab').forEach(t => t.classList.remove('active'));
-            event.target.classList.add('active');
+            document.querySelectorAll('.tab').forEach(t => {
+                t.classList.toggle('active', t.textContent.toLowerCase() === category);
+            });
             
             document.getElementById('news').innerHTML = '<div class="loading">Loading ' + category.toUpperCase() + ' news...</div>';
             
-            try {
-                const response = await fetch('/bloomberg/stories/list?id=' + category);
-                const data = await response.json();
-                
-                if (data.results) {
-                    let html = '';
-                    data.results.forEach(item => {
-                        const encodedUrl = encodeURIComponent(item.url);
-                        html += `
-                            <div class="news-item">
-                                <span class="time">${item.time}</span>
-                                <span class="category">${item.category}</span>
-                                <span class="headline">${item.headline}</span>
-                                <button class="read-btn" onclick="openArticle('${encodedUrl}', event)">READ</button>
-                            </div>
-                        `;
-                    });
-                    document.getElementById('news').innerHTML = html;
-                }
-            } catch (err) {
-                document.getElementById('news').innerHTML = '<div class="loading">Error loading news</div>';
-            }
+            // The server pushes the current list once, then only newly arrived stories
+            if (newsStream) newsStream.close();
+            newsStream = new EventSource('/bloomberg/stories/stream?category=' + category);
+            newsStream.addEventListener('snapshot', (e) => {
+                const data = JSON.parse(e.data);
+                document.getElementById('news').innerHTML = data.results.map(storyHtml).join('');
+            });
+            newsStream.addEventListener('delta', (e) => {
+                const data = JSON.parse(e.data);
+                const container = document.getElementById('news');
+                if (container.querySelector('.loading')) container.innerHTML = '';
+                container.insertAdjacentHTML('afterbegin', data.results.map(storyHtml).join(''));
+                // Keep the list as long as /stories/list would return
+                while (container.children.length > 20) container.lastElementChild.remove();
+            });
+            newsStream.addEventListener('error', (e) => {
+                // Connection drops have no data and EventSource reconnects by itself
+                if (e.data) document.getElementById('news').innerHTML = '<div class="loading">Error loading news</div>';
+            });
         }
         
+        // URL of the article the modal is currently showing
+        let activeArticle = null;
+        
         async function openArticle(encodedUrl, event) {
             event.stopPropagation();
             const url = decodeURIComponent(encodedUrl);
             const modal = document.getElementById('articleModal');
             const content = document.getElementById('modalContent');
+            activeArticle = url;
             
             modal.classList.add('active');
             content.innerHTML = `
@@ -625,10 +2749,16 @@ async def bloomberg_terminal():
             `;
             
             try {
-                const response = await fetch('/bloomberg/article?url=' + encodedUrl);
-                const data = await response.json();
+                // Queue the scrape, then follow the job until it finishes
+                const response = await fetch('/bloomberg/article/jobs?url=' + encodedUrl, { method: 'POST' });
+                let data = await response.json();
+                if (!response.ok) throw new Error(data.detail || 'Request failed');
+                data = await waitForJob(data);
                 
-                if (data.success && data.article) {
+                // The user may have moved on to another article meanwhile
+                if (activeArticle !== url) return;
+                
+                if (data.status === 'done' && data.article) {
                     const article = data.article;
                     let imagesHtml = '';
                     
@@ -676,6 +2806,7 @@ async def bloomberg_terminal():
                     `;
                 }
             } catch (err) {
+                if (activeArticle !== url) return;
                 content.innerHTML = `
                     <div class="error-msg">
                         <h2>Error loading article</h2>
@@ -688,6 +2819,35 @@ async def bloomberg_terminal():
             }
         }
         
+        // Resolve with the finished job, streaming status updates and falling back to polling
+        function waitForJob(job) {
+            return new Promise((resolve, reject) => {
+                if (job.status === 'done' || job.status === 'failed') return resolve(job);
+                
+                const source = new EventSource('/bloomberg/article/jobs/' + job.job_id + '/stream');
+                const finish = (e) => {
+                    source.close();
+                    resolve(JSON.parse(e.data));
+                };
+                source.addEventListener('done', finish);
+                source.addEventListener('failed', finish);
+                source.onerror = () => {
+                    source.close();
+                    pollJob(job.job_id).then(resolve, reject);
+                };
+            });
+        }
+        
+        async function pollJob(jobId) {
+            while (true) {
+                await new Promise(r => setTimeout(r, 2000));
+                const response = await fetch('/bloomberg/article/jobs/' + jobId);
+                const job = await response.json();
+                if (!response.ok) throw new Error(job.detail || 'Job not found');
+                if (job.status === 'done' || job.status === 'failed') return job;
+            }
+        }
+        
         function formatContent(content) {
             if (!content) return '<p>No content available</p>';
             // Split by double newlines to create paragraphs
@@ -730,34 +2890,35 @@ async def bloomberg_terminal():
             if (e.target.id === 'articleModal') closeModal();
         });
         
-        // Auto-refresh every 60 seconds
-        setInterval(() => loadNews(currentCategory), 60000);
-        
         // Initial load
         loadNews('all');
     </script>
 </body>
 </html>
 """
-    return html
+BLOOMBERG_TERMINAL_PAGE = StaticPage(BLOOMBERG_TERMINAL_HTML)
+
+@app.get("/terminal", response_class=HTMLResponse)
+async def bloomberg_terminal(request: Request):
+    """Full Bloomberg Terminal HTML page with article modal"""
+    return BLOOMBERG_TERMINAL_PAGE.response(request)
 
 @app.get("/media/audios-trending")
 async def get_trending_audios():
     """Get trending audio content"""
-    async with httpx.AsyncClient() as client:
-        response = await client.get(
-            f"https://{RAPIDAPI_HOST}/media/audios-trending",
-            headers=headers,
-            timeout=30.0
-        )
-        if response.status_code != 200:
-            raise HTTPException(status_code=response.status_code, detail=response.text)
-        return response.json()
+    response = await send_upstream(
+        RAPIDAPI_HOST,
+        "GET",
+        f"https://{RAPIDAPI_HOST}/media/audios-trending",
+        retries=UPSTREAM_RETRIES,
+        headers=headers,
+        timeout=UPSTREAM_TIMEOUT
+    )
+    if response.status_code != 200:
+        raise HTTPException(status_code=response.status_code, detail=response.text)
+    return response.json()
 
-@app.get("/benzinga/terminal", response_class=HTMLResponse)
-async def benzinga_terminal():
-    """Benzinga News Terminal - Clean expandable news feed"""
-    html = """
+BENZINGA_TERMINAL_HTML = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -869,20 +3030,24 @@ async def benzinga_terminal():
     </div>
     
     <script>
-        async function loadNews() {
-            try {
-                const response = await fetch('/api/v1/news/world?provider=benzinga&limit=30');
-                const data = await response.json();
-                
-                if (data.results && data.results.length > 0) {
+        function loadNews() {
+            // The server pushes the current list once, then only newly arrived stories
+            const source = new EventSource('/benzinga/stream');
+            source.addEventListener('snapshot', (e) => {
+                const data = JSON.parse(e.data);
+                if (data.results.length > 0) {
                     renderNews(data.results);
                 } else {
                     document.getElementById('newsList').innerHTML = '<div class="loading">No news available</div>';
                 }
-            } catch (error) {
-                console.error('Error:', error);
-                document.getElementById('newsList').innerHTML = '<div class="loading">Error loading news: ' + error.message + '</div>';
-            }
+            });
+            source.addEventListener('delta', (e) => prependNews(JSON.parse(e.data).results));
+            source.addEventListener('error', (e) => {
+                // Connection drops have no data and EventSource reconnects by itself
+                if (e.data) {
+                    document.getElementById('newsList').innerHTML = '<div class="loading">Error loading news: ' + JSON.parse(e.data).error + '</div>';
+                }
+            });
         }
         
         function formatDate(dateStr) {
@@ -895,34 +3060,45 @@ async def benzinga_terminal():
             return `${day}-${month};${hours}:${mins}`;
         }
         
+        // Element ids stay unique as deltas add items to the top
+        let nextIndex = 0;
+        
+        function createNewsItem(article) {
+            const index = nextIndex++;
+            const item = document.createElement('div');
+            item.className = 'news-item';
+            item.id = 'news-' + index;
+            
+            const dateStr = formatDate(article.date || article.published);
+            const title = article.title || 'No title';
+            const body = article.text || article.body || article.content || 'No content available';
+            const url = article.url || article.link || '#';
+            
+            item.innerHTML = `
+                <div class="news-header" onclick="toggleBody(${index})">
+                    <span class="expand-icon">▶</span>
+                    <span class="news-date">${dateStr}</span>
+                    <span class="news-title">${title}</span>
+                </div>
+                <div class="news-body" id="body-${index}">
+                    ${body}
+                    <br><a href="${url}" target="_blank" class="original-link">OPEN ORIGINAL</a>
+                </div>
+            `;
+            return item;
+        }
+        
         function renderNews(articles) {
             const container = document.getElementById('newsList');
             container.innerHTML = '';
-            
-            articles.forEach((article, index) => {
-                const item = document.createElement('div');
-                item.className = 'news-item';
-                item.id = 'news-' + index;
-                
-                const dateStr = formatDate(article.date || article.published);
-                const title = article.title || 'No title';
-                const body = article.text || article.body || article.content || 'No content available';
-                const url = article.url || article.link || '#';
-                
-                item.innerHTML = `
-                    <div class="news-header" onclick="toggleBody(${index})">
-                        <span class="expand-icon">▶</span>
-                        <span class="news-date">${dateStr}</span>
-                        <span class="news-title">${title}</span>
-                    </div>
-                    <div class="news-body" id="body-${index}">
-                        ${body}
-                        <br><a href="${url}" target="_blank" class="original-link">OPEN ORIGINAL</a>
-                    </div>
-                `;
-                
-                container.appendChild(item);
-            });
+            articles.forEach(article => container.appendChild(createNewsItem(article)));
+        }
+        
+        function prependNews(articles) {
+            const container = document.getElementById('newsList');
+            if (container.querySelector('.loading')) container.innerHTML = '';
+            articles.slice().reverse().forEach(article => container.prepend(createNewsItem(article)));
+            while (container.children.length > 30) container.lastElementChild.remove();
         }
         
         function toggleBody(index) {
@@ -943,117 +3119,326 @@ async def benzinga_terminal():
         
         // Initial load
         loadNews();
-        
-        // Refresh every 2 minutes
-        setInterval(loadNews, 120000);
     </script>
 </body>
 </html>
 """
-    return html
+BENZINGA_TERMINAL_PAGE = StaticPage(BENZINGA_TERMINAL_HTML)
+
+@app.get("/benzinga/terminal", response_class=HTMLResponse)
+async def benzinga_terminal(request: Request):
+    """Benzinga News Terminal - Clean expandable news feed"""
+    return BENZINGA_TERMINAL_PAGE.response(request)
+
+async def load_benzinga_news():
+    """Fetch the Benzinga world news list from the OpenBB platform"""
+    response = await send_upstream(
+        urlsplit(OPENBB_API_URL).netloc,
+        "GET",
+        f"{OPENBB_API_URL}/api/v1/news/world",
+        retries=UPSTREAM_RETRIES,
+        params={"provider": "benzinga", "limit": 30},
+        timeout=UPSTREAM_TIMEOUT
+    )
+    if response.status_code != 200:
+        raise HTTPException(status_code=response.status_code, detail=response.text)
+    results = response.json().get("results", [])
+    return [{**article, "id": article.get("id") or article.get("url") or article.get("title", "")}
+            for article in results]
+
+async def refresh_benzinga_channel():
+    benzinga_channel.publish(await load_benzinga_news())
+
+benzinga_channel = FeedChannel("benzinga", refresh_benzinga_channel, BENZINGA_POLL_INTERVAL)
+
+@app.get("/benzinga/stream")
+async def stream_benzinga_news():
+    """Push new Benzinga stories as Server-Sent Events"""
+    return stream_channel(benzinga_channel, limit=30)
+
+async def fetch_seekingalpha_feed(symbol):
+    """Cached Seeking Alpha news list for a symbol or a market category, with its digest"""
+    # Check if it's a category request or symbol request
+    if symbol.lower() in ["latest", "market-news", "all"]:
+        # Get general market news
+        return await fetch_feed("seekingalpha", SEEKING_ALPHA_HOST, "/news/v2/list", {"size": 40})
+    # Get news for specific symbol
+    return await fetch_feed("seekingalpha", SEEKING_ALPHA_HOST, "/news/list", {"id": symbol.lower(), "size": 30})
+
+class ArticleBodies:
+    """LRU of Seeking Alpha article bodies by article id, shared by list and article calls
+
+    Entries are (body, stripped). Lists file raw HTML without parsing it;
+    the first open of the article strips it and stores the text in its
+    place, so an expand after a list fetch needs neither an upstream call
+    nor another parse. Bodies are measured in characters, and the least
+    recently used go once either max_entries or max_bytes is exceeded.
+    """
+
+    def __init__(self, max_entries, max_bytes):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.stats = {"hits": 0, "misses": 0, "stripped": 0, "evictions": 0}
+
+    def get(self, article_id):
+        entry = self.entries.get(article_id)
+        if entry is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        self.entries.move_to_end(article_id)
+        return entry
+
+    def put(self, article_id, body, stripped=False):
+        if not article_id or not body:
+            return
+        current = self.entries.get(article_id)
+        # Don't trade already-stripped text for the same article's HTML again
+        if current is not None and current[1] and not stripped:
+            self.entries.move_to_end(article_id)
+            return
+        if current is not None:
+            self.size -= len(current[0])
+        self.entries[article_id] = (body, stripped)
+        self.entries.move_to_end(article_id)
+        self.size += len(body)
+        if stripped:
+            self.stats["stripped"] += 1
+        # The newest entry always stays, even when it alone is over max_bytes
+        while len(self.entries) > 1 and (len(self.entries) > self.max_entries or self.size > self.max_bytes):
+            _, (evicted, _) = self.entries.popitem(last=False)
+            self.size -= len(evicted)
+            self.stats["evictions"] += 1
+
+    def info(self):
+        return {
+            "entries": len(self.entries),
+            "max_entries": self.max_entries,
+            "bytes": self.size,
+            "max_bytes": self.max_bytes,
+            **self.stats,
+        }
+
+seekingalpha_bodies = ArticleBodies(SEEKINGALPHA_BODY_CACHE_SIZE, SEEKINGALPHA_BODY_CACHE_MAX_BYTES)
+
+def format_seekingalpha_story(story, symbol):
+    symbols = list(story.tickers)
+    return {
+        "id": story.id,
+        "title": story.title,
+        "date": datetime.fromtimestamp(story.published, timezone.utc).isoformat() if story.published else "",
+        "text": story.text or None,  # None means needs to be fetched
+        "has_body": story.text != "",
+        "url": story.url,
+        "symbols": symbols if symbols else [symbol.upper()] if symbol.lower() not in ["latest", "market-news", "all"] else []
+    }
+
+class SymbolFeed:
+    """Latest formatted Seeking Alpha news for one symbol and its since-cursor index"""
+
+    def __init__(self, symbol):
+        self.symbol = symbol
+        self.index = StoryIndex(max_items=500)
+        self.digest = None
+        self.results = []
+        self.cursor = self.index.cursor
+        self.encoded = None
+
+    async def update(self, news_data, digest):
+        # Only format and ingest when the upstream body actually changed
+        if digest != self.digest:
+            if SEEKINGALPHA_LAZY_BODIES:
+                stories = normalize_stories(SeekingAlphaAdapter(lazy=True), news_data)
+                for article in news_data.get("data", []):
+                    seekingalpha_bodies.put(article.get("id", ""), article.get("attributes", {}).get("content", ""))
+            else:
+                # Stripping 30-40 article bodies takes long enough to stall the event loop
+                stories = await asyncio.to_thread(normalize_stories, SeekingAlphaAdapter(), news_data)
+                if digest == self.digest:
+                    return self
+                for story in stories:
+                    seekingalpha_bodies.put(story.id, story.text, stripped=True)
+            self.results = [format_seekingalpha_story(story, self.symbol) for story in stories]
+            self.cursor = self.index.ingest(self.results)
+            self.digest = digest
+            self.encoded = None
+            schedule_indexing([seekingalpha_document(story) for story in stories])
+        return self
+
+    def body(self):
+        """The full results as a ready-to-send body, rebuilt only after an update"""
+        if self.encoded is None:
+            self.encoded = EncodedBody(render_json({"results": self.results, "cursor": self.cursor}))
+        return self.encoded
+
+    def etag(self, since=None):
+        if since is None:
+            return f'"{self.digest}-{self.cursor}"'
+        return f'"{self.digest}-{self.cursor}-{since}"'
+
+# Per-symbol feeds, least recently used dropped first
+seekingalpha_feeds = OrderedDict()
+
+def seekingalpha_feed(symbol):
+    key = symbol.lower()
+    feed = seekingalpha_feeds.get(key)
+    if feed is None:
+        feed = seekingalpha_feeds[key] = SymbolFeed(symbol)
+        while len(seekingalpha_feeds) > 200:
+            seekingalpha_feeds.popitem(last=False)
+    seekingalpha_feeds.move_to_end(key)
+    return feed
+
+async def load_seekingalpha_news(symbol):
+    """Fetch Seeking Alpha news for a symbol and fold it into the symbol's feed"""
+    news_data, digest = await fetch_seekingalpha_feed(symbol)
+    return await seekingalpha_feed(symbol).update(news_data, digest)
 
 @app.get("/seekingalpha/news/{symbol}")
-async def get_seekingalpha_news(symbol: str = "AAPL"):
+async def get_seekingalpha_news(
+    request: Request,
+    response: Response,
+    symbol: str = "AAPL",
+    since: Optional[str] = Query(None, description="Cursor from a previous response; only newer articles are returned"),
+):
     """Get news for a symbol from Seeking Alpha via RapidAPI"""
-    sa_headers = {
-        "x-rapidapi-host": SEEKING_ALPHA_HOST,
-        "x-rapidapi-key": RAPIDAPI_KEY,
-    }
-    
     try:
-        async with httpx.AsyncClient() as client:
-            import re
-            
-            # Check if it's a category request or symbol request
-            if symbol.lower() in ["latest", "market-news", "all"]:
-                # Get general market news
-                news_response = await client.get(
-                    f"https://{SEEKING_ALPHA_HOST}/news/v2/list",
-                    headers=sa_headers,
-                    params={"size": 40},
-                    timeout=30.0
-                )
-            else:
-                # Get news for specific symbol
-                news_response = await client.get(
-                    f"https://{SEEKING_ALPHA_HOST}/news/list",
-                    headers=sa_headers,
-                    params={"id": symbol.lower(), "size": 30},
-                    timeout=30.0
-                )
-            
-            if news_response.status_code != 200:
-                return {"results": [], "error": f"Failed to get news: {news_response.status_code}"}
-            
-            news_data = news_response.json()
-            articles = news_data.get("data", [])
-            
-            # Get included tickers for symbol lookup
-            included = {item["id"]: item.get("attributes", {}).get("name", "") 
-                       for item in news_data.get("included", []) if item.get("type") == "tag"}
-            
-            results = []
-            for article in articles:
-                attrs = article.get("attributes", {})
-                # Extract text content, strip HTML tags for display
-                content = attrs.get("content", "")
-                clean_content = re.sub(r'<[^>]+>', '', content)
-                
-                # Get related symbols
-                tickers = article.get("relationships", {}).get("primaryTickers", {}).get("data", [])
-                symbols = [included.get(t.get("id"), "") for t in tickers[:3] if included.get(t.get("id"))]
-                
-                results.append({
-                    "id": article.get("id", ""),
-                    "title": attrs.get("title", ""),
-                    "date": attrs.get("publishOn", ""),
-                    "text": clean_content if clean_content else None,  # None means needs to be fetched
-                    "url": f"https://seekingalpha.com{article.get('links', {}).get('self', '')}",
-                    "symbols": symbols if symbols else [symbol.upper()] if symbol.lower() not in ["latest", "market-news", "all"] else []
-                })
-            
-            return {"results": results}
-            
+        feed = await load_seekingalpha_news(symbol)
+        # A cursor from before a restart or an evicted feed can't be resolved, so fall back to the full list
+        if since is not None and feed.index.position(since) is None:
+            since = None
+        
+        etag = feed.etag(since)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        if since is None:
+            return feed.body().response(request, etag_headers(etag))
+        set_etag(response, etag)
+        results, cursor, _ = feed.index.since(since)
+        return {"results": results, "cursor": cursor}
+    except HTTPException as e:
+        return {"results": [], "error": f"Failed to get news: {e.status_code}"}
     except Exception as e:
         return {"results": [], "error": str(e)}
 
+@functools.lru_cache(maxsize=4096)
+def seekingalpha_published(date):
+    """Sort key for a Seeking Alpha publishOn time; unparseable dates sort last"""
+    try:
+        return parse_time(date)
+    except ValueError:
+        return 0.0
+
+@app.get("/seekingalpha/news")
+async def get_seekingalpha_watchlist(
+    request: Request,
+    response: Response,
+    symbols: str = Query(..., description="Comma-separated symbols, e.g. AAPL,MSFT,NVDA"),
+    limit: int = Query(100, ge=1, le=500),
+):
+    """Merged news for several symbols, newest first, in one round trip
+
+    Each symbol comes from its own cached feed; the ones that need fetching
+    are fetched concurrently, SEEKINGALPHA_BATCH_CONCURRENCY at a time.
+    Articles tagged with several of the symbols appear once, with the
+    symbols combined. Symbols that fail are listed under errors.
+    """
+    wanted = list(dict.fromkeys(part.strip().upper() for part in symbols.split(",") if part.strip()))
+    if not wanted:
+        raise HTTPException(status_code=400, detail="No symbols given")
+    if len(wanted) > SEEKINGALPHA_BATCH_MAX_SYMBOLS:
+        raise HTTPException(status_code=400, detail=f"At most {SEEKINGALPHA_BATCH_MAX_SYMBOLS} symbols")
+    
+    semaphore = asyncio.Semaphore(SEEKINGALPHA_BATCH_CONCURRENCY)
+    
+    async def load(symbol):
+        async with semaphore:
+            return await load_seekingalpha_news(symbol)
+    
+    loaded = await asyncio.gather(*(load(symbol) for symbol in wanted), return_exceptions=True)
+    feeds = []
+    errors = {}
+    for symbol, result in zip(wanted, loaded):
+        if isinstance(result, HTTPException):
+            errors[symbol] = f"Failed to get news: {result.status_code}"
+        elif isinstance(result, Exception):
+            errors[symbol] = str(result)
+        else:
+            feeds.append(result)
+    
+    etag = '"%s"' % hashlib.blake2b(
+        "|".join([feed.etag() for feed in feeds] + sorted(errors) + [str(limit)]).encode(), digest_size=16
+    ).hexdigest()
+    if etag_matches(request, etag):
+        return not_modified(etag)
+    
+    merged = {}
+    for feed in feeds:
+        for result in feed.results:
+            seen = merged.get(result["id"])
+            if seen is None:
+                merged[result["id"]] = result
+            elif result["symbols"] != seen["symbols"]:
+                combined = list(dict.fromkeys(seen["symbols"] + result["symbols"]))
+                merged[result["id"]] = {**seen, "symbols": combined}
+    results = sorted(merged.values(), key=lambda result: seekingalpha_published(result["date"]), reverse=True)
+    
+    set_etag(response, etag)
+    return {"results": results[:limit], "symbols": wanted, "errors": errors}
+
+# One push channel per Seeking Alpha symbol with live subscribers
+seekingalpha_channels = {}
+
+def seekingalpha_channel(symbol):
+    key = symbol.lower()
+    channel = seekingalpha_channels.get(key)
+    if channel is None:
+        async def refresh():
+            channel.publish((await load_seekingalpha_news(symbol)).results)
+        channel = FeedChannel(f"seekingalpha:{key}", refresh, FEED_TTLS["seekingalpha"])
+        seekingalpha_channels[key] = channel
+    return channel
+
+@app.get("/seekingalpha/news/{symbol}/stream")
+async def stream_seekingalpha_news(symbol: str):
+    """Push new Seeking Alpha articles for a symbol as Server-Sent Events"""
+    channel = seekingalpha_channel(symbol)
+    
+    def release():
+        if not channel.subscribers:
+            seekingalpha_channels.pop(symbol.lower(), None)
+    
+    return stream_channel(channel, limit=40, on_close=release)
+
 @app.get("/seekingalpha/article/{article_id}")
-async def get_seekingalpha_article(article_id: str):
+async def get_seekingalpha_article(request: Request, response: Response, article_id: str):
     """Get full article content from Seeking Alpha"""
-    sa_headers = {
-        "x-rapidapi-host": SEEKING_ALPHA_HOST,
-        "x-rapidapi-key": RAPIDAPI_KEY,
-    }
-    
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"https://{SEEKING_ALPHA_HOST}/news/get-details",
-                headers=sa_headers,
-                params={"id": article_id},
-                timeout=30.0
-            )
-            
-            if response.status_code != 200:
-                return {"content": "Failed to load article", "error": response.status_code}
-            
-            data = response.json()
-            attrs = data.get("data", {}).get("attributes", {})
-            content = attrs.get("content", "")
-            
-            # Strip HTML
-            import re
-            clean_content = re.sub(r'<[^>]+>', '', content)
-            
-            return {"content": clean_content}
+        entry = seekingalpha_bodies.get(article_id)
+        if entry is None:
+            data, _ = await fetch_json(SEEKING_ALPHA_HOST, "/news/get-details", {"id": article_id})
+            entry = (data.get("data", {}).get("attributes", {}).get("content", ""), False)
+        content, stripped = entry
+        if not stripped:
+            content = await asyncio.to_thread(html_to_text, content)
+            seekingalpha_bodies.put(article_id, content, stripped=True)
+            # Lazy lists index headlines only; the body joins the document once it's been read
+            schedule_indexing([seekingalpha_document(Story(article_id, 0, "", "", text=content))])
+        
+        etag = '"%s"' % hashlib.blake2b(content.encode(), digest_size=16).hexdigest()
+        if etag_matches(request, etag):
+            return not_modified(etag)
+        set_etag(response, etag)
+        return {"content": content}
             
+    except HTTPException as e:
+        return {"content": "Failed to load article", "error": e.status_code}
     except Exception as e:
         return {"content": f"Error: {str(e)}"}
 
-@app.get("/seekingalpha/terminal", response_class=HTMLResponse)
-async def seekingalpha_terminal():
-    """Seeking Alpha News Terminal - Clean expandable news feed"""
-    html = """
+SEEKINGALPHA_TERMINAL_HTML = """
 <!DOCTYPE html>
 <html>
 <head>
@@ -1220,7 +3605,7 @@ async def seekingalpha_terminal():
     </div>
     
     <div class="search-box">
-        <input type="text" id="symbolInput" placeholder="Enter symbol (e.g., AAPL)" value="latest">
+        <input type="text" id="symbolInput" placeholder="Enter symbol or list (e.g., AAPL or AAPL,MSFT)" value="latest">
         <button onclick="loadNews()">SEARCH</button>
     </div>
     <div class="tabs">
@@ -1238,8 +3623,9 @@ async def seekingalpha_terminal():
     
     <script>
         let currentSymbol = 'latest';
+        let newsStream = null;
         
-        async function loadNews(symbol) {
+        function loadNews(symbol) {
             if (symbol) {
                 currentSymbol = symbol;
                 document.getElementById('symbolInput').value = symbol;
@@ -1260,19 +3646,43 @@ async def seekingalpha_terminal():
             const displayName = currentSymbol === 'latest' ? 'Latest Market' : currentSymbol.toUpperCase();
             document.getElementById('newsList').innerHTML = '<div class="loading">Loading ' + displayName + ' news...</div>';
             
-            try {
-                const response = await fetch('/seekingalpha/news/' + currentSymbol);
-                const data = await response.json();
-                
-                if (data.results && data.results.length > 0) {
+            if (newsStream) newsStream.close();
+            newsStream = null;
+            
+            // Several symbols (AAPL,MSFT,...) load as one merged watchlist
+            if (currentSymbol.includes(',')) {
+                fetch('/seekingalpha/news?symbols=' + encodeURIComponent(currentSymbol))
+                    .then(r => r.json())
+                    .then(data => {
+                        if (data.results && data.results.length > 0) {
+                            renderNews(data.results);
+                        } else {
+                            document.getElementById('newsList').innerHTML = '<div class="loading">No news found for ' + currentSymbol + '</div>';
+                        }
+                    })
+                    .catch(e => {
+                        document.getElementById('newsList').innerHTML = '<div class="loading">Error loading news: ' + e + '</div>';
+                    });
+                return;
+            }
+            
+            // The server pushes the current list once, then only newly arrived articles
+            newsStream = new EventSource('/seekingalpha/news/' + encodeURIComponent(currentSymbol) + '/stream');
+            newsStream.addEventListener('snapshot', (e) => {
+                const data = JSON.parse(e.data);
+                if (data.results.length > 0) {
                     renderNews(data.results);
                 } else {
                     document.getElementById('newsList').innerHTML = '<div class="loading">No news found for ' + currentSymbol + '</div>';
                 }
-            } catch (error) {
-                console.error('Error:', error);
-                document.getElementById('newsList').innerHTML = '<div class="loading">Error loading news: ' + error.message + '</div>';
-            }
+            });
+            newsStream.addEventListener('delta', (e) => prependNews(JSON.parse(e.data).results));
+            newsStream.addEventListener('error', (e) => {
+                // Connection drops have no data and EventSource reconnects by itself
+                if (e.data) {
+                    document.getElementById('newsList').innerHTML = '<div class="loading">Error loading news: ' + JSON.parse(e.data).error + '</div>';
+                }
+            });
         }
         
         function formatDate(dateStr) {
@@ -1294,54 +3704,64 @@ async def seekingalpha_terminal():
         // Store articles globally for fetching content later
         let articlesData = [];
         
+        function createNewsItem(article) {
+            // Indexes stay unique as deltas add articles to the top
+            const index = articlesData.push(article) - 1;
+            const item = document.createElement('div');
+            item.className = 'news-item';
+            item.id = 'news-' + index;
+            
+            const dateStr = formatDate(article.date || article.published);
+            const title = escapeHtml(article.title || 'No title');
+            const url = article.url || article.link || '#';
+            const symbols = article.symbols || [];
+            
+            let symbolTags = '';
+            if (symbols.length > 0) {
+                symbolTags = symbols.slice(0, 3).map(s => '<span class="symbol-tag">' + escapeHtml(s) + '</span>').join('');
+            }
+            
+            // Create elements properly to avoid HTML injection issues
+            const header = document.createElement('div');
+            header.className = 'news-header';
+            header.onclick = function() { toggleBody(index); };
+            header.innerHTML = '<span class="expand-icon">▶</span>' +
+                '<span class="news-date">' + dateStr + '</span>' +
+                '<span class="news-title">' + title + symbolTags + '</span>';
+            
+            const bodyDiv = document.createElement('div');
+            bodyDiv.className = 'news-body';
+            bodyDiv.id = 'body-' + index;
+            
+            // Show loading or content
+            const hasContent = article.text && article.text.length > 10;
+            if (hasContent) {
+                bodyDiv.innerHTML = '<p>' + escapeHtml(article.text) + '</p>' +
+                    '<br><a href="' + url + '" target="_blank" class="original-link">OPEN ON SEEKING ALPHA</a>';
+            } else {
+                bodyDiv.innerHTML = '<p class="loading-content">Click to load full article...</p>' +
+                    '<br><a href="' + url + '" target="_blank" class="original-link">OPEN ON SEEKING ALPHA</a>';
+                bodyDiv.dataset.articleId = article.id;
+                bodyDiv.dataset.loaded = 'false';
+            }
+            
+            item.appendChild(header);
+            item.appendChild(bodyDiv);
+            return item;
+        }
+        
         function renderNews(articles) {
-            articlesData = articles;
+            articlesData = [];
             const container = document.getElementById('newsList');
             container.innerHTML = '';
-            
-            articles.forEach((article, index) => {
-                const item = document.createElement('div');
-                item.className = 'news-item';
-                item.id = 'news-' + index;
-                
-                const dateStr = formatDate(article.date || article.published);
-                const title = escapeHtml(article.title || 'No title');
-                const url = article.url || article.link || '#';
-                const symbols = article.symbols || [];
-                
-                let symbolTags = '';
-                if (symbols.length > 0) {
-                    symbolTags = symbols.slice(0, 3).map(s => '<span class="symbol-tag">' + escapeHtml(s) + '</span>').join('');
-                }
-                
-                // Create elements properly to avoid HTML injection issues
-                const header = document.createElement('div');
-                header.className = 'news-header';
-                header.onclick = function() { toggleBody(index); };
-                header.innerHTML = '<span class="expand-icon">▶</span>' +
-                    '<span class="news-date">' + dateStr + '</span>' +
-                    '<span class="news-title">' + title + symbolTags + '</span>';
-                
-                const bodyDiv = document.createElement('div');
-                bodyDiv.className = 'news-body';
-                bodyDiv.id = 'body-' + index;
-                
-                // Show loading or content
-                const hasContent = article.text && article.text.length > 10;
-                if (hasContent) {
-                    bodyDiv.innerHTML = '<p>' + escapeHtml(article.text) + '</p>' +
-                        '<br><a href="' + url + '" target="_blank" class="original-link">OPEN ON SEEKING ALPHA</a>';
-                } else {
-                    bodyDiv.innerHTML = '<p class="loading-content">Click to load full article...</p>' +
-                        '<br><a href="' + url + '" target="_blank" class="original-link">OPEN ON SEEKING ALPHA</a>';
-                    bodyDiv.dataset.articleId = article.id;
-                    bodyDiv.dataset.loaded = 'false';
-                }
-                
-                item.appendChild(header);
-                item.appendChild(bodyDiv);
-                container.appendChild(item);
-            });
+            articles.forEach(article => container.appendChild(createNewsItem(article)));
+        }
+        
+        function prependNews(articles) {
+            const container = document.getElementById('newsList');
+            if (container.querySelector('.loading')) container.innerHTML = '';
+            articles.slice().reverse().forEach(article => container.prepend(createNewsItem(article)));
+            while (container.children.length > 40) container.lastElementChild.remove();
         }
         
         async function toggleBody(index) {
@@ -1387,14 +3807,16 @@ async def seekingalpha_terminal():
         
         // Initial load - latest news
         loadNews('latest');
-        
-        // Refresh every 2 minutes
-        setInterval(() => loadNews(currentSymbol), 120000);
     </script>
 </body>
 </html>
 """
-    return html
+SEEKINGALPHA_TERMINAL_PAGE = StaticPage(SEEKINGALPHA_TERMINAL_HTML)
+
+@app.get("/seekingalpha/terminal", response_class=HTMLResponse)
+async def seekingalpha_terminal(request: Request):
+    """Seeking Alpha News Terminal - Clean expandable news feed"""
+    return SEEKINGALPHA_TERMINAL_PAGE.response(request)
 
 if __name__ == "__main__":
     import uvicorn
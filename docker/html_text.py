@@ -0,0 +1,76 @@
+"""HTML to plain text for article bodies shown in the terminals
+
+Every step is a compiled pattern or str.replace with a constant
+replacement, so the work per tag stays in C: source whitespace becomes
+spaces, script/style/comments are dropped, block-level tags become line
+breaks (paragraphs and headings a blank line, <br> and each list item a
+single one), table cells are set apart by a space and every other tag
+disappears. Entities are decoded
+afterwards, so an escaped "&lt;p&gt;" comes out as text rather than being
+taken for a tag.
+"""
+import html
+import re
+
+# What a tag turns into: a blank line for paragraph-level tags, a line
+# break for <br> and opening list items, a space for table cells, nothing
+# for everything else
+PARAGRAPH_TAGS = (
+    "p", "div", "section", "article", "header", "footer", "aside", "blockquote", "pre",
+    "h1", "h2", "h3", "h4", "h5", "h6", "ul", "ol", "dl", "table", "figure", "figcaption", "hr",
+)
+LINE_TAGS = ("br", "li", "dt", "dd", "tr")
+CELL_TAGS = ("td", "th")
+
+HIDDEN = re.compile(r"<(script|style)\b.*?(?:</\1\s*>|$)|<!--.*?(?:-->|$)", re.S | re.I)
+# A run of paragraph tags becomes one blank line, and a break swallows the
+# space after it, which leaves little for the cleanup passes to do
+_PARAGRAPH_TAG = r"</?(?:%s)\b[^>]*>" % "|".join(PARAGRAPH_TAGS)
+PARAGRAPH = re.compile(r"%s(?: *%s)* ?" % (_PARAGRAPH_TAG, _PARAGRAPH_TAG))
+LINE = re.compile(r"<(?:%s)\b[^>]*> ?" % "|".join(LINE_TAGS))
+# Likewise a run of cell tags becomes a single space, so adjacent cells
+# don't leave double spaces behind for SPACES to collapse
+_CELL_TAG = r"</?(?:%s)\b[^>]*>" % "|".join(CELL_TAGS)
+CELL = re.compile(r"%s(?: *%s)* ?" % (_CELL_TAG, _CELL_TAG))
+# Markup is nearly always lowercase, and re.I makes these patterns about 3x
+# slower, so the case-insensitive versions only run when a tag has capitals
+PARAGRAPH_ANY_CASE = re.compile(PARAGRAPH.pattern, re.I)
+LINE_ANY_CASE = re.compile(LINE.pattern, re.I)
+CELL_ANY_CASE = re.compile(CELL.pattern, re.I)
+UPPERCASE_TAG = re.compile(r"</?[a-z0-9]*[A-Z]")
+TAG = re.compile(r"<[a-zA-Z/!?][^>]*>")
+SPACES = re.compile(r" {2,}")
+
+def html_to_text(markup):
+    """Readable text of an HTML fragment, with paragraph breaks kept"""
+    if not markup:
+        return ""
+    # Source whitespace means nothing in HTML; the only line breaks are the tags'
+    text = markup
+    for char in "\n\r\t\f":
+        if char in text:
+            text = text.replace(char, " ")
+    if "<" in text:
+        if UPPERCASE_TAG.search(text):
+            text = HIDDEN.sub("", text)
+            paragraph, line, cell = PARAGRAPH_ANY_CASE, LINE_ANY_CASE, CELL_ANY_CASE
+        else:
+            if "<script" in text or "<style" in text or "<!--" in text:
+                text = HIDDEN.sub("", text)
+            paragraph, line, cell = PARAGRAPH, LINE, CELL
+        text = paragraph.sub("\n\n", text)
+        text = line.sub("\n", text)
+        if "<t" in text or "<T" in text:
+            text = cell.sub(" ", text)
+        text = TAG.sub("", text)
+    if "  " in text:
+        text = SPACES.sub(" ", text)
+    if "\n" in text:
+        # Spaces were already collapsed, so at most one sits beside a break
+        text = text.replace(" \n", "\n").replace("\n ", "\n")
+        while "\n\n\n" in text:
+            text = text.replace("\n\n\n", "\n\n")
+    # Decoded last: entities can make the text non-ASCII, which slows every pass after
+    if "&" in text:
+        text = html.unescape(text)
+    return text.strip()
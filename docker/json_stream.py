@@ -0,0 +1,159 @@
+"""Incremental JSON decoding that only builds the parts of a document asked for
+
+A JSONPathStream is fed a response body chunk by chunk and hands back each
+value found at one of its paths as soon as that value is complete. A path
+is a tuple of object keys, with "*" for every element of an array, e.g.
+("data", "modules", "*", "stories", "*") for every Bloomberg story.
+
+Values are decoded by the json module's C scanner. Only the wanted ones
+are kept: anything off the paths is decoded one value at a time and
+dropped straight away. Consumed input is dropped as parsing goes, so
+neither the whole body nor its full object tree is held at once.
+"""
+import codecs
+import json
+import re
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+DECODER = json.JSONDecoder()
+
+def path_tree(paths):
+    """Nested dicts of path steps, with each path's label at its leaf"""
+    tree = {}
+    for path, label in paths.items():
+        node = tree
+        for step in path[:-1]:
+            node = node.setdefault(step, {})
+        node[path[-1]] = label
+    return tree
+
+class JSONPathStream:
+    """Pull the values at paths (a {path: label} dict) out of a JSON body as it arrives"""
+
+    def __init__(self, paths):
+        self.tree = path_tree(paths)
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.buffer = ""
+        self.pos = 0
+        self.finished = False
+        self.done = False
+        self.found = []
+        self.parser = self.document()
+
+    def feed(self, chunk):
+        """Add the next bytes of the body; returns the (label, value) pairs they completed"""
+        self.buffer = self.buffer[self.pos:] + self.decoder.decode(chunk)
+        self.pos = 0
+        return self.resume()
+
+    def close(self):
+        """End of body; returns the last pairs, or raises ValueError if the document is cut short"""
+        self.buffer = self.buffer[self.pos:] + self.decoder.decode(b"", final=True)
+        self.pos = 0
+        self.finished = True
+        found = self.resume()
+        if not self.done:
+            raise ValueError("Truncated JSON document")
+        return found
+
+    def resume(self):
+        if not self.done:
+            try:
+                next(self.parser)
+            except StopIteration:
+                self.done = True
+        found, self.found = self.found, []
+        return found
+
+    # The parser below is one generator: every step that runs out of input
+    # yields, and resume() picks it up where it stopped once more arrives.
+
+    def more(self):
+        if self.finished:
+            raise ValueError("Truncated JSON document")
+        yield
+
+    def document(self):
+        yield from self.value(self.tree)
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                raise ValueError(f"Extra data after JSON document at {self.pos}")
+            if self.finished:
+                return
+            yield
+
+    def peek(self):
+        """The next non-whitespace character, without consuming it"""
+        while True:
+            self.pos = WHITESPACE.match(self.buffer, self.pos).end()
+            if self.pos < len(self.buffer):
+                return self.buffer[self.pos]
+            yield from self.more()
+
+    def decode(self):
+        """Decode one whole value"""
+        yield from self.peek()
+        while True:
+            try:
+                value, end = DECODER.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError:
+                if self.finished:
+                    raise
+            else:
+                # A number or literal is only finished once something that can follow it has arrived
+                if (self.finished or self.buffer[self.pos] in '"[{'
+                        or (end < len(self.buffer) and self.buffer[end] in " \t\n\r,]}")):
+                    self.pos = end
+                    return value
+            # Try again once the value's share of the buffer has doubled, so a
+            # value spread over many chunks is still decoded in linear time
+            size = len(self.buffer) - self.pos
+            while not self.finished and len(self.buffer) - self.pos < 2 * size:
+                yield
+
+    def skip(self):
+        """Move past one value without keeping it"""
+        # Decoding in C and dropping the result beats scanning for brackets in Python
+        yield from self.decode()
+
+    def value(self, node):
+        """Walk one value, collecting what node (a subtree or a leaf label) asks for"""
+        if isinstance(node, str):
+            value = yield from self.decode()
+            self.found.append((node, value))
+            return
+        char = yield from self.peek()
+        if char == "[" and "*" in node:
+            child = node["*"]
+            self.pos += 1
+            while True:
+                char = yield from self.peek()
+                if char == "]":
+                    self.pos += 1
+                    return
+                if char == ",":
+                    self.pos += 1
+                    continue
+                yield from self.value(child)
+        elif char == "{":
+            self.pos += 1
+            while True:
+                char = yield from self.peek()
+                if char == "}":
+                    self.pos += 1
+                    return
+                if char == ",":
+                    self.pos += 1
+                    continue
+                key = yield from self.decode()
+                if (yield from self.peek()) != ":":
+                    raise ValueError(f"Expected ':' at {self.pos}")
+                self.pos += 1
+                child = node.get(key)
+                if child is None:
+                    yield from self.skip()
+                else:
+                    yield from self.value(child)
+        else:
+            yield from self.skip()
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Cost of turning Seeking Alpha article HTML into display text
+
+Builds article fixtures shaped like Seeking Alpha news bodies (paragraphs,
+bullet lists, links, tables, entities; a few KB for a news item up to
+~60 KB for a long analysis) and measures:
+
+  old regex  the uncompiled re.sub(r'<[^>]+>', '', ...) the handlers used
+  html_text  html_to_text from docker/html_text.py
+
+per article and for a 40-article list response, then how long the event
+loop stalls while a 40-article response is formatted inline versus in a
+worker thread.
+
+Usage: python scripts/benchmark_html_text.py [seconds-per-case]
+"""
+import asyncio
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "docker"))
+
+from html_text import html_to_text  # noqa: E402
+
+WORDS = ("revenue growth quarter guidance margin shares investors analysts company's "
+         "billion percent year-over-year demand outlook market dividend buyback earnings "
+         "estimates consensus segment operating cash flow").split()
+
+def sentence(rnd):
+    words = [rnd.choice(WORDS) for _ in range(rnd.randint(8, 24))]
+    if rnd.random() < 0.3:
+        words[rnd.randrange(len(words))] = '<a href="https://seekingalpha.com/symbol/AAPL">AAPL</a>'
+    if rnd.random() < 0.2:
+        words[rnd.randrange(len(words))] = "<strong>&quot;record&quot;</strong>"
+    if rnd.random() < 0.2:
+        words.append("&amp; S&amp;P&nbsp;500 &#8212; up 3.2%")
+    return " ".join(words).capitalize() + "."
+
+def article(rnd, paragraphs):
+    parts = []
+    for i in range(paragraphs):
+        if i % 7 == 3:
+            parts.append("<ul>" + "".join(f"<li>{sentence(rnd)}</li>" for _ in range(4)) + "</ul>")
+        elif i % 11 == 5:
+            rows = "".join(f"<tr><td>Q{q}</td><td>${rnd.randint(10, 99)}.{rnd.randint(0, 9)}B</td></tr>"
+                           for q in range(1, 5))
+            parts.append(f'<table class="table">{rows}</table>')
+        elif i % 9 == 0:
+            parts.append(f"<h2>{sentence(rnd)}</h2>")
+        else:
+            parts.append("<p>" + " ".join(sentence(rnd) for _ in range(rnd.randint(2, 5))) + "</p>")
+    return "\n".join(parts)
+
+def fixtures():
+    rnd = random.Random(7)
+    return {
+        "news item": [article(rnd, 6) for _ in range(40)],
+        "long analysis": [article(rnd, 120) for _ in range(40)],
+    }
+
+def old_strip(content):
+    return re.sub(r'<[^>]+>', '', content)
+
+def measure(function, articles, seconds):
+    count = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        for content in articles:
+            function(content)
+        count += len(articles)
+    return (time.perf_counter() - started) / count
+
+async def worst_stall(format_response):
+    """Longest gap between ticks of a 1 ms timer while format_response runs"""
+    worst = 0.0
+    done = False
+
+    async def ticker():
+        nonlocal worst
+        last = time.perf_counter()
+        while not done:
+            await asyncio.sleep(0.001)
+            now = time.perf_counter()
+            worst = max(worst, now - last)
+            last = now
+
+    task = asyncio.create_task(ticker())
+    await asyncio.sleep(0.01)
+    await format_response()
+    done = True
+    await task
+    return worst
+
+async def stalls(articles):
+    async def inline():
+        [html_to_text(content) for content in articles]
+
+    async def threaded():
+        await asyncio.to_thread(lambda: [html_to_text(content) for content in articles])
+
+    return await worst_stall(inline), await worst_stall(threaded)
+
+def main(seconds):
+    print(f"{'fixture':<16}{'avg bytes':>10}{'old regex':>14}{'html_text':>14}{'40 articles':>14}")
+    for name, articles in fixtures().items():
+        size = sum(map(len, articles)) // len(articles)
+        old = measure(old_strip, articles, seconds)
+        new = measure(html_to_text, articles, seconds)
+        print(f"{name:<16}{size:>10}{old * 1e6:>11.1f} us{new * 1e6:>11.1f} us{new * 40 * 1e3:>11.2f} ms")
+    print()
+    print(f"{'fixture':<16}{'loop stall inline':>20}{'loop stall thread':>20}")
+    for name, articles in fixtures().items():
+        inline, threaded = asyncio.run(stalls(articles))
+        print(f"{name:<16}{inline * 1e3:>17.2f} ms{threaded * 1e3:>17.2f} ms")
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 1.0)
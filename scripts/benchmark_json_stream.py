@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""Full json.loads versus streamed parsing of a Bloomberg news/list body
+
+Builds news/list payloads shaped like the real ones (story modules next to
+layout/ad/video modules the proxy never reads, stories with many fields it
+drops) at a few sizes, splits each into 16 KB chunks as they would come off
+the socket, and compares:
+
+  full      join the chunks, json.loads the body, pick out the stories
+            (what fetch_upstream_json did before)
+  streamed  feed the chunks to JSONPathStream as they arrive
+
+for CPU time, peak traced memory, and time to first story over a simulated
+link (the full parse can't start before the last byte is in).
+
+Usage: python scripts/benchmark_json_stream.py [link MB/s]
+"""
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "docker"))
+
+from json_stream import JSONPathStream  # noqa: E402
+
+CHUNK = 16 * 1024
+PATHS = {("status",): "status", ("data", "modules", "*", "stories", "*"): "stories"}
+
+def story(i):
+    return {
+        "id": f"S{i:06d}", "internalID": f"I{i:06d}", "type": "article",
+        "title": f"Markets wrap {i}: stocks, bonds and the dollar move as traders weigh the data",
+        "headline": f"Markets wrap {i}", "published": 1792190000 - i * 60, "lastModified": 1792190000 - i * 30,
+        "primarySite": "markets", "url": f"https://www.bloomberg.com/news/articles/2026-10-16/story-{i}",
+        "shortURL": f"https://bloom.bg/{i:x}", "thumbnailImage": f"https://assets.bwbx.io/images/{i}/thumb.jpg",
+        "summary": "Summary text of the story, a couple of sentences long. " * 4,
+        "byline": "By A Reporter and Another Reporter", "authors": [{"id": str(i % 50), "name": "A Reporter"}],
+        "eyebrow": {"text": "Markets", "url": "/markets"}, "wordCount": 900 + i % 400, "premium": i % 3 == 0,
+        "image": {"url": f"https://assets.bwbx.io/images/{i}/full.jpg", "width": 1200, "height": 800,
+                  "caption": "Traders work on the floor of the exchange. " * 2, "credit": "Photographer/Bloomberg"},
+        "abstract": ["First point of the story.", "Second point of the story."],
+    }
+
+def filler(i):
+    """A module the proxy never reads: layout, ads and video metadata"""
+    return {
+        "id": f"M{i}", "type": "video_carousel", "title": "Latest video",
+        "items": [{"id": f"V{i}-{j}", "title": "Video title " * 3, "duration": 120 + j,
+                   "renditions": [{"url": f"https://video/{i}/{j}/{q}.mp4", "bitrate": q * 1000} for q in (1, 2, 4)],
+                   "ad": {"slot": f"/123/{i}/{j}", "targeting": {"pos": str(j), "kw": ["a", "b", "c"]}}}
+                  for j in range(40)],
+    }
+
+def payload(stories):
+    modules = []
+    for m in range(0, stories, 25):
+        modules.append({"id": f"module-{m}", "stories": [story(i) for i in range(m, min(m + 25, stories))]})
+        modules.append(filler(m))
+    return json.dumps({"status": True, "data": {"modules": modules, "meta": {"generated": time.time()}}}).encode()
+
+def full(chunks):
+    data = json.loads(b"".join(chunks))
+    stories = [s for module in data["data"]["modules"] for s in module.get("stories", [])]
+    return stories, None
+
+def streamed(chunks):
+    parser = JSONPathStream(PATHS)
+    stories = []
+    first = None
+    started = time.perf_counter()
+    for index, chunk in enumerate(chunks):
+        for label, value in parser.feed(chunk):
+            if label == "stories":
+                if first is None:
+                    first = (index, time.perf_counter() - started)
+                stories.append(value)
+    parser.close()
+    return stories, first
+
+def run(function, chunks):
+    tracemalloc.start()
+    started = time.perf_counter()
+    stories, first = function(chunks)
+    elapsed = time.perf_counter() - started
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    # CPU time without tracing, best of a few runs
+    best = min(timed(function, chunks) for _ in range(3))
+    return stories, first, best, peak, elapsed
+
+def timed(function, chunks):
+    started = time.perf_counter()
+    function(chunks)
+    return time.perf_counter() - started
+
+def main(link):
+    rate = link * 1024 * 1024
+    print(f"link {link:g} MB/s, {CHUNK // 1024} KB chunks")
+    print(f"{'body':>9}{'stories':>9}  {'mode':<10}{'cpu ms':>9}{'peak MB':>9}{'first story ms':>16}")
+    for count in (100, 500, 2500):
+        body = payload(count)
+        chunks = [body[i:i + CHUNK] for i in range(0, len(body), CHUNK)]
+        transfer = len(body) / rate
+        results = {}
+        for name, function in (("full", full), ("streamed", streamed)):
+            stories, first, cpu, peak, _ = run(function, chunks)
+            results[name] = stories
+            if first is None:
+                # Nothing is usable until the whole body is in and parsed
+                first_ms = (transfer + cpu) * 1000
+            else:
+                index, spent = first
+                first_ms = ((index + 1) * CHUNK / rate + spent) * 1000
+            print(f"{len(body) / 1024:>7.0f}KB{len(stories):>9}  {name:<10}{cpu * 1000:>9.1f}"
+                  f"{peak / 1024 / 1024:>9.2f}{first_ms:>16.1f}")
+        assert results["full"] == results["streamed"]
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 5.0)
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""Requests/sec of the bloomberg proxy's JSON feed endpoints, in process
+
+Drives the ASGI app directly (no sockets, no HTTP client) against
+synthetic Bloomberg and Seeking Alpha payloads seeded into the feed cache,
+so the numbers are the proxy's own per-request cost. Each endpoint is
+measured three ways:
+
+  stdlib    the feed dict re-encoded per request by JSONResponse (before)
+  orjson    the feed dict re-encoded per request by FastJSONResponse
+  prebuilt  the snapshot's ready-to-send bytes (what the endpoints now do)
+
+Usage: python scripts/benchmark_proxy.py [seconds-per-case]
+"""
+import asyncio
+import os
+import sys
+import time
+
+# Seeded feeds must never expire or be refreshed during a run
+os.environ["BLOOMBERG_FEED_TTL"] = os.environ["SEEKINGALPHA_FEED_TTL"] = "1e9"
+os.environ["BLOOMBERG_POLL_INTERVAL"] = "0"
+os.environ["ARTICLE_CACHE_PATH"] = ""
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "docker"))
+
+import bloomberg_proxy as bp  # noqa: E402
+from fastapi.responses import JSONResponse  # noqa: E402
+
+SITES = ["markets", "technology", "politics", "wealth", "pursuits", "businessweek", "green"]
+
+def bloomberg_payload(count=120):
+    now = int(time.time())
+    stories = [{
+        "id": f"S{i:05d}",
+        "title": f"Markets wrap {i}: stocks, bonds and the dollar move as traders weigh the data",
+        "published": now - i * 90,
+        "primarySite": SITES[i % len(SITES)],
+        "url": f"https://www.bloomberg.com/news/articles/2026-10-16/story-{i}",
+        "thumbnailImage": f"https://assets.bwbx.io/images/{i}/thumb.jpg",
+        "summary": "Summary text " * 20,
+    } for i in range(count)]
+    return {"status": True, "data": {"modules": [{"stories": stories[:count // 2]}, {"stories": stories[count // 2:]}]}}
+
+def seekingalpha_payload(count=30):
+    return {
+        "data": [{
+            "id": str(4000000 + i),
+            "type": "news",
+            "attributes": {
+                "title": f"Apple headline number {i}",
+                "publishOn": "2026-10-16T09:30:00-04:00",
+                "content": "<p>" + "Article body sentence with some detail. " * 80 + "</p>",
+            },
+            "relationships": {"primaryTickers": {"data": [{"id": "146", "type": "tag"}]}},
+            "links": {"self": f"/news/{4000000 + i}-apple-headline"},
+        } for i in range(count)],
+        "included": [{"id": "146", "type": "tag", "attributes": {"name": "AAPL"}}],
+    }
+
+def seed_feeds():
+    bp.feed_cache.set(bp.request_key(bp.RAPIDAPI_HOST, "/news/list"), (bloomberg_payload(), "bench-bloomberg"))
+    bp.feed_cache.set(bp.request_key(bp.SEEKING_ALPHA_HOST, "/news/list", {"id": "aapl", "size": 30}),
+                      (seekingalpha_payload(), "bench-seekingalpha"))
+
+def add_baseline_routes():
+    """The endpoints as they were: build the dict, let the response class encode it"""
+    async def stories_dict(id: str = "markets"):
+        return (await bp.get_bloomberg_snapshot()).view(id)
+
+    async def seekingalpha_dict(symbol: str):
+        feed = await bp.load_seekingalpha_news(symbol)
+        return {"results": feed.results, "cursor": feed.cursor}
+
+    for prefix, response_class in (("/_stdlib", JSONResponse), ("/_orjson", bp.FastJSONResponse)):
+        bp.app.add_api_route(prefix + "/stories/list", stories_dict, response_class=response_class)
+        bp.app.add_api_route(prefix + "/seekingalpha/news/{symbol}", seekingalpha_dict, response_class=response_class)
+
+async def request(path, headers=()):
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET",
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": list(headers), "client": ("127.0.0.1", 50000), "server": ("127.0.0.1", 8000),
+    }
+    size = 0
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        nonlocal size
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"{path} returned {message['status']}")
+        if message["type"] == "http.response.body":
+            size += len(message.get("body", b""))
+
+    await bp.app(scope, receive, send)
+    return size
+
+async def measure(path, seconds, headers=()):
+    size = await request(path, headers)
+    count = 0
+    started = time.perf_counter()
+    deadline = started + seconds
+    while time.perf_counter() < deadline:
+        for _ in range(50):
+            await request(path, headers)
+        count += 50
+    return count / (time.perf_counter() - started), size
+
+async def main(seconds):
+    seed_feeds()
+    add_baseline_routes()
+    orjson = bp.orjson
+    gzip_header = [(b"accept-encoding", b"gzip")]
+    cases = [
+        ("stories/list", "stdlib", "/_stdlib/stories/list", ()),
+        ("stories/list", "orjson", "/_orjson/stories/list", ()),
+        ("stories/list", "prebuilt", "/stories/list", ()),
+        ("stories/list", "prebuilt+gzip", "/stories/list", gzip_header),
+        ("seekingalpha/news", "stdlib", "/_stdlib/seekingalpha/news/AAPL", ()),
+        ("seekingalpha/news", "orjson", "/_orjson/seekingalpha/news/AAPL", ()),
+        ("seekingalpha/news", "prebuilt", "/seekingalpha/news/AAPL", ()),
+        ("seekingalpha/news", "prebuilt+gzip", "/seekingalpha/news/AAPL", gzip_header),
+    ]
+    print(f"{'endpoint':<20}{'mode':<16}{'req/s':>10}{'bytes':>10}")
+    for endpoint, label, path, headers in cases:
+        if label == "orjson" and orjson is None:
+            print(f"{endpoint:<20}{label:<16}{'n/a (orjson not installed)':>20}")
+            continue
+        rate, size = await measure(path, seconds, headers)
+        print(f"{endpoint:<20}{label:<16}{rate:>10.0f}{size:>10}")
+
+if __name__ == "__main__":
+    asyncio.run(main(float(sys.argv[1]) if len(sys.argv) > 1 else 2.0))